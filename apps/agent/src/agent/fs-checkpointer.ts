@@ -29,23 +29,61 @@ interface ThreadCheckpoints {
  * - Properly tracks parent checkpoint relationships
  * - Stores checkpoint metadata for building conversation tree
  * - Returns checkpoints in proper order for history display
+ *
+ * Writes are deferred by one event-loop turn so bursts of puts share a single
+ * file write; pending writes are flushed on exit and on SIGINT/SIGTERM. A hard
+ * crash (or SIGKILL) inside that window can still lose the last superstep.
  */
 export class FileSystemCheckpointer extends BaseCheckpointSaver {
   private readonly filePath: string;
   private checkpoints: Record<string, ThreadCheckpoints> = {};
+  private savePending = false;
+  /** mtime of the file as last read or written; -1 when it was never loaded */
+  private loadedMtimeMs = -1;
 
   constructor(filePath = ".checkpoints.json") {
     super();
     this.filePath = path.resolve(getGlobalDataDir(), filePath);
     this.load();
+    this.flushOnShutdown();
+  }
+
+  /**
+   * Write any deferred save before the process goes away. The signal handlers
+   * are one-shot and re-raise the signal, so default termination still applies.
+   */
+  private flushOnShutdown() {
+    process.once("exit", () => this.flush());
+    for (const signal of ["SIGINT", "SIGTERM"] as const) {
+      process.once(signal, () => {
+        this.flush();
+        process.kill(process.pid, signal);
+      });
+    }
   }
 
   private load() {
+    // Unsaved changes make memory the source of truth; write them out instead
+    // of reading back a stale file
+    if (this.savePending) {
+      this.flush();
+      return;
+    }
+
     try {
-      if (fs.existsSync(this.filePath)) {
-        this.checkpoints = JSON.parse(fs.readFileSync(this.filePath, "utf-8"));
+      // Every read path calls load(); re-parsing the whole file is only
+      // needed when something else has written it since
+      const { mtimeMs } = fs.statSync(this.filePath);
+      if (mtimeMs === this.loadedMtimeMs) {
+        return;
       }
+      this.checkpoints = JSON.parse(fs.readFileSync(this.filePath, "utf-8"));
+      this.loadedMtimeMs = mtimeMs;
     } catch (e) {
+      // Nothing persisted yet — keep the in-memory state
+      if ((e as NodeJS.ErrnoException).code === "ENOENT") {
+        return;
+      }
       console.error("[FileSystemCheckpointer] Failed to load checkpoints:", e);
       this.checkpoints = {};
     }
@@ -54,11 +92,29 @@ export class FileSystemCheckpointer extends BaseCheckpointSaver {
   private save() {
     try {
       fs.writeFileSync(this.filePath, JSON.stringify(this.checkpoints, null, 2));
+      this.loadedMtimeMs = fs.statSync(this.filePath).mtimeMs;
     } catch (e) {
       console.error("[FileSystemCheckpointer] Failed to save checkpoints:", e);
     }
   }
 
+  /**
+   * Defer the write to the end of the current turn of the event loop so that
+   * bursts of puts (one per superstep and parallel branch) share a single
+   * serialize-and-write of the whole file.
+   */
+  private scheduleSave() {
+    if (this.savePending) return;
+    this.savePending = true;
+    setImmediate(() => this.flush());
+  }
+
+  private flush() {
+    if (!this.savePending) return;
+    this.savePending = false;
+    this.save();
+  }
+
   async getTuple(config: RunnableConfig): Promise<CheckpointTuple | undefined> {
     const thread_id = config.configurable?.thread_id;
     const checkpoint_id = config.configurable?.checkpoint_id;
@@ -186,7 +242,7 @@ export class FileSystemCheckpointer extends BaseCheckpointSaver {
     threadData.checkpoints[checkpoint.id] = stored;
     threadData.latestId = checkpoint.id;
 
-    this.save();
+    this.scheduleSave();
 
     return {
       configurable: {
@@ -207,7 +263,7 @@ export class FileSystemCheckpointer extends BaseCheckpointSaver {
   async deleteThread(thread_id: string): Promise<void> {
     if (this.checkpoints[thread_id]) {
       delete this.checkpoints[thread_id];
-      this.save();
+      this.scheduleSave();
     }
   }
 
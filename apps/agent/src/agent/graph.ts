@@ -1,5 +1,6 @@
 import type { AIMessage } from "@langchain/core/messages";
 import { END, START, StateGraph } from "@langchain/langgraph";
+import { agentConfig } from "../lib/config.js";
 import { FileSystemCheckpointer } from "./fs-checkpointer.js";
 import { AgentNode } from "./nodes/agent.js";
 import { ApprovalGate } from "./nodes/approval-gate.js";
@@ -12,92 +13,64 @@ import { type AgentState, AgentStateAnnotation } from "./state.js";
 // Re-export state annotation for LangSmith introspection
 export { AgentStateAnnotation };
 
-initializeMemory();
+// Connecting to Qdrant and the embedding provider is the only eager work done
+// at import; skip it entirely when memory is disabled
+if (agentConfig.ENABLE_MEMORY) {
+  initializeMemory();
+}
 
 /**
  * Route after AgentNode: tool calls always go to ApprovalGate
  */
 const routeAfterAgent = (state: AgentState): "ApprovalGate" | "EndMiddleware" => {
-  const lastMessage = state.messages.at(-1);
-
-  // No message or not AI message -> end
-  if (!lastMessage || lastMessage._getType() !== "ai") {
-    return "EndMiddleware";
-  }
-
-  const aiMessage = lastMessage as AIMessage;
-  const toolCalls = aiMessage.tool_calls || [];
+  // Only AI messages carry tool_calls, so one optional read covers both the
+  // "not an AI message" and "no tool calls" cases
+  const toolCalls = (state.messages.at(-1) as AIMessage | undefined)?.tool_calls;
 
   // No tool calls -> end
-  if (toolCalls.length === 0) {
+  if (!toolCalls?.length) {
     return "EndMiddleware";
   }
 
   // All tool calls go through ApprovalGate
-  console.log("[Graph] Routing to ApprovalGate for tool processing");
   return "ApprovalGate";
 };
 
-/**
- * Route after ApprovalGate:
- * - If tools were rejected -> AgentNode (with ToolMessage feedback)
- * - If tools approved -> ToolExecution
- */
-const routeAfterApproval = (state: AgentState): "ToolExecution" | "AgentNode" => {
-  // If tools were rejected, route back to AgentNode with feedback
-  if (state.tools_rejected) {
-    console.log("[Graph] Tools rejected, routing to AgentNode with feedback");
-    return "AgentNode";
-  }
-
-  // Tools approved, execute them
-  return "ToolExecution";
-};
-
-/**
- * After ToolExecution, always loop back to AgentNode for another inference cycle.
- * AgentNode will naturally route to EndMiddleware when there are no more tool calls.
- */
-const shouldContinue = (_state: AgentState): "AgentNode" => {
-  return "AgentNode";
-};
-
 export const checkpointer = new FileSystemCheckpointer();
 
 export const graph = new StateGraph(AgentStateAnnotation)
   .addNode("StartMiddleware", StartMiddleware)
   .addNode("MemoryRetrieval", MemoryRetrieval)
   .addNode("AgentNode", AgentNode)
-  .addNode("ApprovalGate", ApprovalGate)
+  // ApprovalGate routes itself via Command: ToolExecution (approved) or
+  // AgentNode (rejected with ToolMessage feedback)
+  .addNode("ApprovalGate", ApprovalGate, { ends: ["ToolExecution", "AgentNode"] })
   .addNode("ToolExecution", ToolExecution)
   .addNode("EndMiddleware", EndMiddleware)
 
+  // StartMiddleware and MemoryRetrieval write disjoint channels, so they run in
+  // the same superstep; AgentNode waits for both. Memory lookup (an embedding
+  // call plus a vector search) no longer queues behind the start bookkeeping.
   .addEdge(START, "StartMiddleware")
-  .addEdge("StartMiddleware", "MemoryRetrieval")
-  .addEdge("MemoryRetrieval", "AgentNode")
+  .addEdge(START, "MemoryRetrieval")
+  .addEdge(["StartMiddleware", "MemoryRetrieval"], "AgentNode")
 
   // AgentNode -> ApprovalGate (if tools) or EndMiddleware (if no tools)
-  .addConditionalEdges("AgentNode", routeAfterAgent, {
-    ApprovalGate: "ApprovalGate",
-    EndMiddleware: "EndMiddleware",
-  })
-
-  // ApprovalGate -> ToolExecution (approved) or AgentNode (rejected with feedback)
-  .addConditionalEdges("ApprovalGate", routeAfterApproval, {
-    ToolExecution: "ToolExecution",
-    AgentNode: "AgentNode",
-  })
+  .addConditionalEdges("AgentNode", routeAfterAgent, ["ApprovalGate", "EndMiddleware"])
 
-  // ToolExecution -> AgentNode (always continue loop)
-  .addConditionalEdges("ToolExecution", shouldContinue, {
-    AgentNode: "AgentNode",
-  })
+  // ToolExecution -> AgentNode (always continue loop; AgentNode routes to
+  // EndMiddleware once there are no more tool calls)
+  .addEdge("ToolExecution", "AgentNode")
 
   .addEdge("EndMiddleware", END)
 
   .compile({ checkpointer });
 
-console.log("[Graph] Simplified graph compiled:");
-console.log("  Flow: START → Start → Memory → Agent → ApprovalGate → [Tools | Agent] → End → END");
-console.log("  - All tool calls go through ApprovalGate");
-console.log("  - Rejected tools return to AgentNode with ToolMessage feedback");
+console.log(
+  [
+    "[Graph] Simplified graph compiled:",
+    "  Flow: START → [Start ∥ Memory] → Agent → ApprovalGate → [Tools | Agent] → End → END",
+    "  - All tool calls go through ApprovalGate",
+    "  - Rejected tools return to AgentNode with ToolMessage feedback",
+  ].join("\n")
+);
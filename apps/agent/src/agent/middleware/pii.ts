@@ -1,34 +1,89 @@
+import type { BaseMessage } from "@langchain/core/messages";
 import type { AgentState } from "../state.js";
 
+/** PII patterns, compiled once. No `g` flag, so `test()` keeps no lastIndex state. */
+export const PII_PATTERNS: ReadonlyArray<readonly [type: string, pattern: RegExp]> = [
+  ["email", /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/],
+  ["phone", /\b\d{3}[-.]?\d{3}[-.]?\d{4}\b/],
+  ["ssn", /\b\d{3}-\d{2}-\d{4}\b/],
+];
+
 /**
- * PII Detection Node
- * Checks for sensitive information in the last message.
+ * All PII patterns fused into one alternation with a named group per type, so
+ * the text is scanned once however many patterns there are.
  */
-export const piiDetectionNode = async (state: AgentState) => {
-  const messages = state.messages;
-  const lastMessage = messages.at(-1);
+const PII_COMBINED_RE = new RegExp(
+  PII_PATTERNS.map(([type, pattern]) => `(?<${type}>${pattern.source})`).join("|"),
+  "g"
+);
 
-  if (!lastMessage?.content) {
-    return {};
-  }
+/**
+ * Return the PII types found in the given text, in PII_PATTERNS order.
+ */
+export function detectPII(content: string): string[] {
+  // Clean text is the common case: one scan that finds nothing, no allocation
+  PII_COMBINED_RE.lastIndex = 0;
+  let match = PII_COMBINED_RE.exec(content);
+  if (!match) return [];
 
-  const content =
-    typeof lastMessage.content === "string"
-      ? lastMessage.content
-      : JSON.stringify(lastMessage.content);
+  const found = new Set<string>();
+  while (match) {
+    // The alternation reports one type per span, but spans can hold several
+    // (a phone number as an email local part), so check the short matched
+    // text against the types not seen yet
+    const span = match[0];
+    for (const [type, pattern] of PII_PATTERNS) {
+      if (!found.has(type) && (match.groups?.[type] !== undefined || pattern.test(span))) {
+        found.add(type);
+      }
+    }
+    // Every type already seen; the rest of the text cannot change the answer
+    if (found.size === PII_PATTERNS.length) break;
+    match = PII_COMBINED_RE.exec(content);
+  }
+  return PII_PATTERNS.filter(([type]) => found.has(type)).map(([type]) => type);
+}
 
-  const PII_PATTERNS = {
-    email: /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/g,
-    phone: /\b\d{3}[-.]?\d{3}[-.]?\d{4}\b/g,
-  };
+/**
+ * The part of a message worth scanning for PII: string content as-is and only
+ * the text blocks of multimodal content. Tool results and non-text blocks
+ * (images, tool calls) are skipped instead of being serialized to JSON.
+ */
+export function getPIIScanText(message: BaseMessage | undefined): string {
+  if (!message?.content || message._getType() === "tool") {
+    return "";
+  }
 
-  const detected: string[] = [];
+  const { content } = message;
+  if (typeof content === "string") {
+    return content;
+  }
 
-  for (const [type, pattern] of Object.entries(PII_PATTERNS)) {
-    if (pattern.test(content)) {
-      detected.push(type);
+  const parts: string[] = [];
+  for (const c of content) {
+    if (typeof c === "string") {
+      parts.push(c);
+      continue;
+    }
+    const block = c as { type?: string; text?: string };
+    if (block.type === "text" && block.text) {
+      parts.push(block.text);
     }
   }
+  return parts.join("\n");
+}
+
+/**
+ * PII Detection Node
+ * Checks for sensitive information in the last message.
+ */
+export const piiDetectionNode = async (state: AgentState) => {
+  const content = getPIIScanText(state.messages.at(-1));
+  if (!content) {
+    return {};
+  }
+
+  const detected = detectPII(content);
 
   if (detected.length > 0) {
     console.warn(`[PIIDetection] ⚠️ PII detected: ${detected.join(", ")}`);
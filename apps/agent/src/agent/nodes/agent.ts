@@ -1,8 +1,14 @@
 import { type BaseMessage, SystemMessage } from "@langchain/core/messages";
 import type { RunnableConfig } from "@langchain/core/runnables";
 import { agentConfig } from "../../lib/config.js";
-import { createLLM, createRuntimeLLM, type RuntimeModelConfig } from "../../lib/llm.js";
-import { SYSTEM_PROMPT } from "../prompt.js";
+import {
+  bindToolsCached,
+  createLLM,
+  createRuntimeLLM,
+  MODEL_CALL_OPTIONS,
+  type RuntimeModelConfig,
+} from "../../lib/llm.js";
+import { buildMemoryContext, buildStaticPrompt } from "../prompt.js";
 import type { AgentGraphNode, AgentState } from "../state.js";
 import { tools } from "../tools/index.js";
 
@@ -13,24 +19,84 @@ function isMultimodalContent(content: unknown): boolean {
   );
 }
 
+const VISION_MODELS = [
+  "gpt-4-vision",
+  "gpt-4-turbo",
+  "gpt-4o",
+  "gpt-4o-mini",
+  "gemini",
+  "claude-3",
+  "claude-sonnet",
+  "claude-opus",
+  "claude-haiku",
+  "llava",
+  "cogvlm",
+  "qwen-vl",
+  "qwen",
+];
+
+/** All vision model markers as one case-insensitive alternation, scanned in a single pass */
+const VISION_MODEL_RE = new RegExp(
+  VISION_MODELS.map((vm) => vm.replace(/[.*+?^${}()|[\]\\]/g, "\\$&")).join("|"),
+  "i"
+);
+
 function isVisionModel(modelName: string): boolean {
-  const visionModels = [
-    "gpt-4-vision",
-    "gpt-4-turbo",
-    "gpt-4o",
-    "gpt-4o-mini",
-    "gemini",
-    "claude-3",
-    "claude-sonnet",
-    "claude-opus",
-    "claude-haiku",
-    "llava",
-    "cogvlm",
-    "qwen-vl",
-    "qwen",
+  return VISION_MODEL_RE.test(modelName);
+}
+
+/**
+ * Build the system message with the stable instructions first and per-turn
+ * context (retrieved memories) after them, so provider-side prompt caches
+ * keyed on the prefix keep hitting across turns. Anthropic only caches up to
+ * an explicit breakpoint, so the static block is marked there.
+ */
+function buildSystemMessage(
+  staticPrompt: string,
+  dynamicContext: string,
+  markCacheBreakpoint: boolean
+): SystemMessage {
+  if (!markCacheBreakpoint) {
+    return new SystemMessage(
+      dynamicContext ? `${staticPrompt}\n\n${dynamicContext}` : staticPrompt
+    );
+  }
+
+  const content: Array<Record<string, unknown>> = [
+    { type: "text", text: staticPrompt, cache_control: { type: "ephemeral" } },
   ];
-  const lowerModel = modelName.toLowerCase();
-  return visionModels.some((vm) => lowerModel.includes(vm));
+  if (dynamicContext) {
+    content.push({ type: "text", text: dynamicContext });
+  }
+  return new SystemMessage({ content: content as any });
+}
+
+/**
+ * Flatten multimodal content to text for models without vision support.
+ * Messages that need no change are returned as-is.
+ */
+function sanitizeMessage(msg: BaseMessage, supportsVision: boolean): BaseMessage {
+  if (!Array.isArray(msg.content)) {
+    return msg;
+  }
+
+  if (supportsVision && isMultimodalContent(msg.content)) {
+    return msg;
+  }
+
+  const textContent = msg.content
+    .map((c: unknown) => {
+      if (typeof c === "string") return c;
+      const block = c as { type?: string; text?: string };
+      return block.type === "text" ? block.text : "";
+    })
+    .filter(Boolean)
+    .join("\n");
+
+  const newMsg = Object.create(Object.getPrototypeOf(msg));
+  Object.assign(newMsg, msg);
+  newMsg.content = textContent || "[Image content - not supported by this model]";
+  return newMsg;
 }
 
 export const AgentNode: AgentGraphNode = async (
@@ -58,13 +124,17 @@ export const AgentNode: AgentGraphNode = async (
     });
     modelName = modelConfig.modelName;
   } else {
-    const mergedConfig = { ...agentConfig };
-    if (modelSettings) {
-      if (modelSettings.temperature !== undefined)
-        mergedConfig.TEMPERATURE = modelSettings.temperature as number;
-      if (modelSettings.maxTokens !== undefined)
-        mergedConfig.MAX_TOKENS = modelSettings.maxTokens as number;
-    }
+    // Only copy the (large) env config when the request actually overrides it
+    const temperature = modelSettings?.temperature as number | undefined;
+    const maxTokens = modelSettings?.maxTokens as number | undefined;
+    const mergedConfig =
+      temperature !== undefined || maxTokens !== undefined
+        ? {
+            ...agentConfig,
+            TEMPERATURE: temperature ?? agentConfig.TEMPERATURE,
+            MAX_TOKENS: maxTokens ?? agentConfig.MAX_TOKENS,
+          }
+        : agentConfig;
     llm = await createLLM(mergedConfig);
     modelName = agentConfig.MODEL_NAME;
   }
@@ -84,63 +154,36 @@ export const AgentNode: AgentGraphNode = async (
       invocationConfig.presence_penalty = modelSettings.presencePenalty;
   }
 
-  const llmWithTools = llm.bindTools(
-    tools,
-    Object.keys(invocationConfig).length > 0 ? invocationConfig : undefined
-  );
-
-  let systemPrompt = SYSTEM_PROMPT;
+  const llmWithTools = bindToolsCached(llm, tools, invocationConfig);
 
-  if (modelSettings?.systemPrompt) {
-    systemPrompt += `\n\n<user_instructions>\n${modelSettings.systemPrompt}\n</user_instructions>`;
-  }
+  const staticPrompt = buildStaticPrompt(modelSettings?.systemPrompt as string | undefined);
 
-  const memories = state.metadata?.retrieved_memories;
-  if (memories && memories.length > 0) {
-    const memoryContext = memories
-      .map((m: unknown, i: number) => {
-        const mem = m as { content?: string };
-        return `${i + 1}. ${mem.content}`;
-      })
-      .join("\n");
-    systemPrompt += `\n\nContext from previous conversations:\n${memoryContext}`;
-  }
+  const dynamicContext = buildMemoryContext(state.metadata?.retrieved_memories);
 
-  let messages = state.messages;
-  const hasSystemPrompt = messages.some((msg: BaseMessage) => msg._getType() === "system");
+  const supportsVision = isVisionModel(modelName);
 
-  if (!hasSystemPrompt) {
-    messages = [new SystemMessage(systemPrompt), ...messages];
+  // Sanitize and prepend the system prompt in one pass; unshift() after map()
+  // would copy the whole history a second time on long conversations.
+  // A system prompt is only ever placed at the head of the conversation.
+  const { messages } = state;
+  const needsSystemPrompt = messages[0]?._getType() !== "system";
+  const offset = needsSystemPrompt ? 1 : 0;
+  const sanitizedMessages: BaseMessage[] = new Array(messages.length + offset);
+
+  if (needsSystemPrompt) {
+    const provider = modelConfig?.provider ?? agentConfig.MODEL_PROVIDER;
+    sanitizedMessages[0] = buildSystemMessage(
+      staticPrompt,
+      dynamicContext,
+      provider === "anthropic"
+    );
   }
 
-  const supportsVision = isVisionModel(modelName);
-
-  const sanitizedMessages = messages.map((msg: BaseMessage) => {
-    if (Array.isArray(msg.content)) {
-      const hasImages = isMultimodalContent(msg.content);
-
-      if (hasImages && supportsVision) {
-        return msg;
-      }
-
-      const textContent = msg.content
-        .map((c: unknown) => {
-          if (typeof c === "string") return c;
-          const block = c as { type?: string; text?: string };
-          return block.type === "text" ? block.text : "";
-        })
-        .filter(Boolean)
-        .join("\n");
-
-      const newMsg = Object.create(Object.getPrototypeOf(msg));
-      Object.assign(newMsg, msg);
-      newMsg.content = textContent || "[Image content - not supported by this model]";
-      return newMsg;
-    }
-    return msg;
-  });
+  for (let i = 0; i < messages.length; i++) {
+    sanitizedMessages[i + offset] = sanitizeMessage(messages[i], supportsVision);
+  }
 
-  const response = await llmWithTools.invoke(sanitizedMessages);
+  const response = await llmWithTools.invoke(sanitizedMessages, MODEL_CALL_OPTIONS);
 
   return { messages: [response], model_calls: 1 };
 };
@@ -1,9 +1,11 @@
 import { type AIMessage, ToolMessage } from "@langchain/core/messages";
 import type { RunnableConfig } from "@langchain/core/runnables";
-import { interrupt } from "@langchain/langgraph";
+import { Command, interrupt } from "@langchain/langgraph";
 import type { AgentState } from "../state.js";
 import { getToolApprovalConfig, getToolRiskLevel, needsApproval } from "../tools/index.js";
 
+type PendingToolCall = NonNullable<AIMessage["tool_calls"]>[number];
+
 interface ActionRequest {
   name: string;
   arguments: Record<string, unknown>;
@@ -29,6 +31,18 @@ interface HitlDecision {
   };
 }
 
+/**
+ * Apply the gate's state update and pick the next node in one step:
+ * fully rejected tool calls go back to AgentNode with ToolMessage feedback,
+ * everything else proceeds to ToolExecution.
+ */
+function routeWith(update: Partial<AgentState>): Command {
+  return new Command({
+    update,
+    goto: update.tools_rejected ? "AgentNode" : "ToolExecution",
+  });
+}
+
 /**
  * ApprovalGate Node
  *
@@ -46,25 +60,19 @@ interface HitlDecision {
 export async function ApprovalGate(
   state: AgentState,
   config: RunnableConfig
-): Promise<Partial<AgentState>> {
-  const lastMessage = state.messages.at(-1);
-
-  if (!lastMessage || lastMessage._getType() !== "ai") {
-    return { tools_rejected: false };
-  }
-
-  const aiMessage = lastMessage as AIMessage;
-  const toolCalls = aiMessage.tool_calls || [];
+): Promise<Command> {
+  // Only AI messages carry tool_calls
+  const toolCalls = (state.messages.at(-1) as AIMessage | undefined)?.tool_calls;
 
-  if (toolCalls.length === 0) {
-    return { tools_rejected: false };
+  if (!toolCalls?.length) {
+    return routeWith({ tools_rejected: false });
   }
 
   const approvalConfig = getToolApprovalConfig(config);
 
   // Separate tools into auto-approved and need-approval
-  const autoApprovedTools: typeof toolCalls = [];
-  const toolsNeedingApproval: typeof toolCalls = [];
+  const autoApprovedTools: PendingToolCall[] = [];
+  const toolsNeedingApproval: PendingToolCall[] = [];
 
   for (const tc of toolCalls) {
     if (needsApproval(tc.name, approvalConfig)) {
@@ -76,7 +84,7 @@ export async function ApprovalGate(
 
   // If no tools need approval, proceed directly
   if (toolsNeedingApproval.length === 0) {
-    return { tools_rejected: false };
+    return routeWith({ tools_rejected: false });
   }
 
   // Build HITL request for tools needing approval
@@ -105,10 +113,10 @@ export async function ApprovalGate(
           tc.name
         )
     );
-    return {
+    return routeWith({
       messages: toolMessages,
       tools_rejected: true,
-    };
+    });
   }
 
   // Process decisions
@@ -142,22 +150,22 @@ export async function ApprovalGate(
 
   // If all tools needing approval were rejected
   if (rejectedToolNames.length === toolsNeedingApproval.length) {
-    return {
+    return routeWith({
       messages: toolMessages,
       tools_rejected: true,
-    };
+    });
   }
 
   // If some tools were rejected but others approved
   if (rejectedToolNames.length > 0) {
     // Return ToolMessages for rejected tools, but allow approved ones to proceed
-    return {
+    return routeWith({
       messages: toolMessages,
       tools_rejected: false, // Allow approved tools to execute
-    };
+    });
   }
 
   // All tools approved
 
-  return { tools_rejected: false };
+  return routeWith({ tools_rejected: false });
 }
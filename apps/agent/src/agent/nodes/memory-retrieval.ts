@@ -51,7 +51,8 @@ export async function MemoryRetrieval(
     return updates;
   }
 
-  const lastUserMessage = [...state.messages].reverse().find((msg) => msg._getType() === "human") as
+  // Scan from the tail without copying the history
+  const lastUserMessage = state.messages.findLast((msg) => msg._getType() === "human") as
     | HumanMessage
     | undefined;
 
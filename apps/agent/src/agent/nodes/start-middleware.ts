@@ -1,6 +1,10 @@
 import type { RunnableConfig } from "@langchain/core/runnables";
 import { agentConfig } from "../../lib/config.js";
-import type { AgentGraphNode, AgentState } from "../state.js";
+import { detectPII, getPIIScanText } from "../middleware/pii.js";
+import type { AgentGraphNode, AgentState, AgentStateUpdate } from "../state.js";
+
+// Env config is fixed for the process lifetime; resolve it once
+const PII_DETECTION_ENABLED = agentConfig.ENABLE_PII_DETECTION;
 
 /**
  * StartMiddleware Node
@@ -12,39 +16,21 @@ import type { AgentGraphNode, AgentState } from "../state.js";
 export const StartMiddleware: AgentGraphNode = async (
   state: AgentState,
   _config: RunnableConfig
-): Promise<Partial<AgentState>> => {
-  const updates: Partial<AgentState> = {};
+): Promise<AgentStateUpdate> => {
+  const updates: AgentStateUpdate = {};
 
   // Set start time
   updates.start_time = Date.now();
 
   // PII Detection
-  if (agentConfig.ENABLE_PII_DETECTION) {
-    const lastMessage = state.messages.at(-1);
-    if (lastMessage?.content) {
-      const content =
-        typeof lastMessage.content === "string"
-          ? lastMessage.content
-          : JSON.stringify(lastMessage.content);
-
-      const PII_PATTERNS = {
-        email: /\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b/g,
-        phone: /\b\d{3}[-.]?\d{3}[-.]?\d{4}\b/g,
-        ssn: /\b\d{3}-\d{2}-\d{4}\b/g,
-      };
-
-      const detectedTypes: string[] = [];
-      for (const [type, pattern] of Object.entries(PII_PATTERNS)) {
-        if (pattern.test(content)) {
-          detectedTypes.push(type);
-          pattern.lastIndex = 0;
-        }
-      }
+  if (PII_DETECTION_ENABLED) {
+    const content = getPIIScanText(state.messages.at(-1));
+    if (content) {
+      const detectedTypes = detectPII(content);
 
       if (detectedTypes.length > 0) {
         console.warn(`[PIIDetection] Detected: ${detectedTypes.join(", ")}`);
         updates.middleware_metrics = {
-          ...state.middleware_metrics,
           pii_detected: true,
           pii_types: detectedTypes,
         };
@@ -1,84 +1,159 @@
 import { type AIMessage, ToolMessage } from "@langchain/core/messages";
 import type { RunnableConfig } from "@langchain/core/runnables";
+import { ToolInputParsingException } from "@langchain/core/tools";
 import { v4 as uuidv4 } from "uuid";
 import { agentConfig } from "../../lib/config.js";
-import type { AgentGraphNode, AgentState, UIMessage } from "../state.js";
+import type { AgentGraphNode, AgentState, AgentStateUpdate, UIMessage } from "../state.js";
 import { toolMap } from "../tools/index.js";
 
-async function emitUIEvent(config: RunnableConfig, uiMessage: UIMessage): Promise<void> {
+// Env config is fixed for the process lifetime; resolve it once
+const MAX_TOOL_RETRIES = agentConfig.MAX_RETRIES || 3;
+const INITIAL_RETRY_DELAY_MS = agentConfig.INITIAL_DELAY * 1000;
+const RETRY_BACKOFF_FACTOR = agentConfig.BACKOFF_FACTOR;
+const MAX_RETRY_DELAY_MS = 30_000;
+
+/**
+ * Read-only tools that can safely overlap with each other. Everything else
+ * (shell, artifacts, sub-agents) may depend on an earlier call's side effects,
+ * e.g. present_artifact right after create_artifact, so it runs on its own.
+ */
+const PARALLEL_SAFE_TOOLS: ReadonlySet<string> = new Set([
+  "search_web",
+  "fetch_url_content",
+  "get_weather",
+]);
+
+/**
+ * Exponential backoff capped at MAX_RETRY_DELAY_MS, with jitter so that
+ * concurrently failing calls don't all retry in lockstep
+ */
+function retryDelayMs(attempt: number): number {
+  const ceiling = Math.min(
+    MAX_RETRY_DELAY_MS,
+    INITIAL_RETRY_DELAY_MS * RETRY_BACKOFF_FACTOR ** attempt
+  );
+  return INITIAL_RETRY_DELAY_MS + Math.random() * Math.max(0, ceiling - INITIAL_RETRY_DELAY_MS);
+}
+
+/**
+ * Invalid arguments fail the same way on every attempt, so retrying them only
+ * delays the error reaching the model
+ */
+function isRetryableToolError(error: unknown): boolean {
+  return !(error instanceof ToolInputParsingException);
+}
+
+type UIEventEmitter = (uiMessage: UIMessage) => Promise<void>;
+
+const noopEmitter: UIEventEmitter = async () => {};
+
+/**
+ * Resolve the UI event sink once per node run instead of probing the config
+ * on every emitted event
+ */
+function getUIEventEmitter(config: RunnableConfig): UIEventEmitter {
   const streamEvents = (config as any).streamEvents;
-  if (streamEvents && typeof streamEvents === "function") {
+  if (typeof streamEvents !== "function") {
+    return noopEmitter;
+  }
+  return async (uiMessage) => {
     await streamEvents({
       event: "ui",
       data: uiMessage,
     });
-  }
+  };
+}
+
+type PendingToolCall = NonNullable<AIMessage["tool_calls"]>[number];
+
+interface ToolCallOutcome {
+  toolMessage: ToolMessage;
+  uiMessages: UIMessage[];
+  retries: number;
 }
 
 /**
- * ToolExecution Node
- *
- * Executes approved tool calls. Works with ApprovalGate:
- * - ApprovalGate may have already added ToolMessages for rejected tools
- * - This node only executes tools that don't have ToolMessage responses yet
- * - Finds the AI message with tool calls and executes tools not already handled
+ * Execute a single tool call with retries, emitting its UI lifecycle events
  */
-export const ToolExecution: AgentGraphNode = async (
-  state: AgentState,
-  config: RunnableConfig
-): Promise<Partial<AgentState>> => {
-  // Find the last AI message with tool calls
-  const aiMessage = [...state.messages]
-    .reverse()
-    .find((msg) => msg._getType() === "ai" && (msg as AIMessage).tool_calls?.length);
-
-  if (!aiMessage) {
-    return {};
-  }
+async function executeToolCall(
+  toolCall: PendingToolCall,
+  emitUIEvent: UIEventEmitter
+): Promise<ToolCallOutcome> {
+  const toolName = toolCall.name;
+  const toolArgs = toolCall.args || {};
+  const toolCallId = toolCall.id || uuidv4();
 
-  const toolCalls = (aiMessage as AIMessage).tool_calls || [];
+  const tool = toolMap.get(toolName);
+  const uiMessageId = uuidv4();
+  const uiMessages: UIMessage[] = [];
 
-  if (toolCalls.length === 0) {
-    return {};
-  }
+  if (!tool) {
+    console.error(`[ToolExecution] Tool "${toolName}" not found`);
 
-  // Get tool_call_ids that already have ToolMessage responses (from ApprovalGate rejections)
-  const existingToolCallIds = new Set(
-    state.messages
-      .filter((msg) => msg._getType() === "tool")
-      .map((msg) => (msg as ToolMessage).tool_call_id)
-  );
+    const errorUIMessage: UIMessage = {
+      id: uiMessageId,
+      name: toolName,
+      props: {
+        toolName,
+        status: "failed",
+        args: toolArgs,
+        error: `Tool "${toolName}" not found`,
+        completedAt: Date.now(),
+      },
+      metadata: {
+        tool_call_id: toolCallId,
+        tool_name: toolName,
+      },
+    };
 
-  // Filter out tools that already have responses (were rejected)
-  const toolsToExecute = toolCalls.filter((tc) => !existingToolCallIds.has(tc.id || ""));
+    uiMessages.push(errorUIMessage);
+    await emitUIEvent(errorUIMessage);
 
-  if (toolsToExecute.length === 0) {
-    return {};
+    return {
+      toolMessage: new ToolMessage(`Error: Tool "${toolName}" not found`, toolCallId, toolName),
+      uiMessages,
+      retries: 0,
+    };
   }
 
-  const toolMessages: ToolMessage[] = [];
-  const uiMessages: UIMessage[] = [];
-  let totalRetries = 0;
+  // Emit start UI message
+  const startUIMessage: UIMessage = {
+    id: uiMessageId,
+    name: toolName,
+    props: {
+      toolName,
+      status: "executing",
+      args: toolArgs,
+      startedAt: Date.now(),
+    },
+    metadata: {
+      tool_call_id: toolCallId,
+      tool_name: toolName,
+    },
+  };
 
-  for (const toolCall of toolsToExecute) {
-    const toolName = toolCall.name;
-    const toolArgs = toolCall.args || {};
-    const toolCallId = toolCall.id || uuidv4();
+  uiMessages.push(startUIMessage);
+  await emitUIEvent(startUIMessage);
 
-    const tool = toolMap[toolName];
-    const uiMessageId = uuidv4();
+  let result: string;
+  let retries = 0;
+  const startedAt = Date.now();
 
-    if (!tool) {
-      console.error(`[ToolExecution] Tool "${toolName}" not found`);
+  while (true) {
+    try {
+      const toolResult = await (tool as any).invoke(toolArgs);
+      result = typeof toolResult === "string" ? toolResult : JSON.stringify(toolResult);
 
-      const errorUIMessage: UIMessage = {
+      // Emit completion UI message
+      const completeUIMessage: UIMessage = {
         id: uiMessageId,
         name: toolName,
         props: {
           toolName,
-          status: "failed",
+          status: "completed",
           args: toolArgs,
-          error: `Tool "${toolName}" not found`,
+          result,
+          startedAt,
           completedAt: Date.now(),
         },
         metadata: {
@@ -87,53 +162,28 @@ export const ToolExecution: AgentGraphNode = async (
         },
       };
 
-      uiMessages.push(errorUIMessage);
-      await emitUIEvent(config, errorUIMessage);
+      uiMessages.push(completeUIMessage);
+      await emitUIEvent(completeUIMessage);
 
-      toolMessages.push(
-        new ToolMessage(`Error: Tool "${toolName}" not found`, toolCallId, toolName)
+      break;
+    } catch (error) {
+      retries++;
+      const errorMessage = error instanceof Error ? error.message : String(error);
+      console.error(
+        `[ToolExecution] ${toolName} failed (${retries}/${MAX_TOOL_RETRIES}): ${errorMessage}`
       );
-      continue;
-    }
 
-    // Emit start UI message
-    const startUIMessage: UIMessage = {
-      id: uiMessageId,
-      name: toolName,
-      props: {
-        toolName,
-        status: "executing",
-        args: toolArgs,
-        startedAt: Date.now(),
-      },
-      metadata: {
-        tool_call_id: toolCallId,
-        tool_name: toolName,
-      },
-    };
-
-    uiMessages.push(startUIMessage);
-    await emitUIEvent(config, startUIMessage);
-
-    let result: string;
-    let retries = 0;
-    const maxRetries = agentConfig.MAX_RETRIES || 3;
-    const startedAt = Date.now();
-
-    while (true) {
-      try {
-        const toolResult = await (tool as any).invoke(toolArgs);
-        result = typeof toolResult === "string" ? toolResult : JSON.stringify(toolResult);
+      if (retries >= MAX_TOOL_RETRIES || !isRetryableToolError(error)) {
+        result = `Error after ${retries} attempts: ${errorMessage}`;
 
-        // Emit completion UI message
-        const completeUIMessage: UIMessage = {
+        const failUIMessage: UIMessage = {
           id: uiMessageId,
           name: toolName,
           props: {
             toolName,
-            status: "completed",
+            status: "failed",
             args: toolArgs,
-            result,
+            error: errorMessage,
             startedAt,
             completedAt: Date.now(),
           },
@@ -143,61 +193,115 @@ export const ToolExecution: AgentGraphNode = async (
           },
         };
 
-        uiMessages.push(completeUIMessage);
-        await emitUIEvent(config, completeUIMessage);
+        uiMessages.push(failUIMessage);
+        await emitUIEvent(failUIMessage);
 
         break;
-      } catch (error) {
-        retries++;
-        totalRetries++;
-        const errorMessage = error instanceof Error ? error.message : String(error);
-        console.error(
-          `[ToolExecution] ${toolName} failed (${retries}/${maxRetries}): ${errorMessage}`
-        );
-
-        if (retries >= maxRetries) {
-          result = `Error after ${retries} attempts: ${errorMessage}`;
-
-          const failUIMessage: UIMessage = {
-            id: uiMessageId,
-            name: toolName,
-            props: {
-              toolName,
-              status: "failed",
-              args: toolArgs,
-              error: errorMessage,
-              startedAt,
-              completedAt: Date.now(),
-            },
-            metadata: {
-              tool_call_id: toolCallId,
-              tool_name: toolName,
-            },
-          };
-
-          uiMessages.push(failUIMessage);
-          await emitUIEvent(config, failUIMessage);
-
-          break;
-        }
-
-        await new Promise((resolve) => setTimeout(resolve, 2 ** retries * 1000));
       }
+
+      await new Promise((resolve) => setTimeout(resolve, retryDelayMs(retries)));
     }
+  }
+
+  return { toolMessage: new ToolMessage(result, toolCallId, toolName), uiMessages, retries };
+}
 
-    toolMessages.push(new ToolMessage(result, toolCallId, toolName));
+/**
+ * Run tool calls in the order the model issued them, overlapping consecutive
+ * read-only calls (see PARALLEL_SAFE_TOOLS). All other tools run one at a time.
+ */
+async function executeToolCalls(
+  toolCalls: PendingToolCall[],
+  emitUIEvent: UIEventEmitter
+): Promise<ToolCallOutcome[]> {
+  const outcomes: ToolCallOutcome[] = [];
+  let batch: PendingToolCall[] = [];
+
+  const flush = async () => {
+    if (batch.length === 0) return;
+    const pending = batch;
+    batch = [];
+    outcomes.push(...(await Promise.all(pending.map((tc) => executeToolCall(tc, emitUIEvent)))));
+  };
+
+  for (const toolCall of toolCalls) {
+    if (PARALLEL_SAFE_TOOLS.has(toolCall.name)) {
+      batch.push(toolCall);
+    } else {
+      await flush();
+      outcomes.push(await executeToolCall(toolCall, emitUIEvent));
+    }
   }
+  await flush();
+
+  return outcomes;
+}
 
-  const updates: Partial<AgentState> = {
+/**
+ * ToolExecution Node
+ *
+ * Executes approved tool calls. Works with ApprovalGate:
+ * - ApprovalGate may have already added ToolMessages for rejected tools
+ * - This node only executes tools that don't have ToolMessage responses yet
+ * - Finds the AI message with tool calls and executes tools not already handled
+ */
+export const ToolExecution: AgentGraphNode = async (
+  state: AgentState,
+  config: RunnableConfig
+): Promise<AgentStateUpdate> => {
+  // Find the last AI message with tool calls
+  const { messages } = state;
+  const aiIndex = messages.findLastIndex(
+    (msg) => msg._getType() === "ai" && (msg as AIMessage).tool_calls?.length
+  );
+
+  if (aiIndex === -1) {
+    return {};
+  }
+
+  const toolCalls = (messages[aiIndex] as AIMessage).tool_calls || [];
+
+  if (toolCalls.length === 0) {
+    return {};
+  }
+
+  // Get tool_call_ids that already have ToolMessage responses (from ApprovalGate
+  // rejections). Responses can only follow the AI message that issued the calls,
+  // so only the tail after it needs scanning, not the whole history.
+  const existingToolCallIds = new Set<string>();
+  for (let i = aiIndex + 1; i < messages.length; i++) {
+    const msg = messages[i]!;
+    if (msg._getType() === "tool") {
+      existingToolCallIds.add((msg as ToolMessage).tool_call_id);
+    }
+  }
+
+  // Filter out tools that already have responses (were rejected)
+  const toolsToExecute = toolCalls.filter((tc) => !existingToolCallIds.has(tc.id || ""));
+
+  if (toolsToExecute.length === 0) {
+    return {};
+  }
+
+  const emitUIEvent = getUIEventEmitter(config);
+  const outcomes = await executeToolCalls(toolsToExecute, emitUIEvent);
+
+  const toolMessages: ToolMessage[] = [];
+  const uiMessages: UIMessage[] = [];
+  let totalRetries = 0;
+  for (const outcome of outcomes) {
+    toolMessages.push(outcome.toolMessage);
+    uiMessages.push(...outcome.uiMessages);
+    totalRetries += outcome.retries;
+  }
+
+  const updates: AgentStateUpdate = {
     messages: toolMessages,
     ui: uiMessages,
   };
 
   if (totalRetries > 0) {
-    updates.middleware_metrics = {
-      ...state.middleware_metrics,
-      retries: totalRetries,
-    };
+    updates.middleware_metrics = { retries: totalRetries };
   }
 
   return updates;
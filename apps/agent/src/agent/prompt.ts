@@ -109,3 +109,30 @@ When facing complex problems:
 4. Verify results when possible
 5. Summarize what you did and any caveats
 </reasoning>`;
+
+/**
+ * The system prompt with the user's custom instructions appended
+ */
+export function buildStaticPrompt(userInstructions?: string): string {
+  if (!userInstructions) {
+    return SYSTEM_PROMPT;
+  }
+  return `${SYSTEM_PROMPT}\n\n<user_instructions>\n${userInstructions}\n</user_instructions>`;
+}
+
+/**
+ * The per-turn memory block appended after the static prompt
+ */
+export function buildMemoryContext(memories: readonly unknown[] | undefined): string {
+  if (!memories || memories.length === 0) {
+    return "";
+  }
+
+  const memoryContext = memories
+    .map((m: unknown, i: number) => {
+      const mem = m as { content?: string };
+      return `${i + 1}. ${mem.content}`;
+    })
+    .join("\n");
+  return `Context from previous conversations:\n${memoryContext}`;
+}
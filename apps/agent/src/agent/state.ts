@@ -94,11 +94,14 @@ export interface MiddlewareMetrics {
 }
 
 /**
- * Custom reducer for executed_tool_calls: append to array
+ * Shared append reducer for list channels (tool calls, errors, sub-agents).
+ * Empty updates keep the existing array instead of copying it.
  */
-function toolCallsReducer(current: ToolCall[], update: ToolCall | ToolCall[]): ToolCall[] {
-  const updates = Array.isArray(update) ? update : [update];
-  return [...current, ...updates];
+function appendReducer<T>(current: T[], update: T | T[]): T[] {
+  if (!Array.isArray(update)) {
+    return [...current, update];
+  }
+  return update.length === 0 ? current : current.concat(update);
 }
 
 /**
@@ -122,14 +125,6 @@ function metricsReducer(
   };
 }
 
-/**
- * Custom reducer for errors: append to array
- */
-function errorsReducer(current: string[], update: string | string[]): string[] {
-  const updates = Array.isArray(update) ? update : [update];
-  return [...current, ...updates];
-}
-
 /**
  * Custom reducer for UI messages: upsert by id
  */
@@ -202,7 +197,7 @@ export const AgentStateAnnotation = Annotation.Root({
 
   // Tool tracking (for logging/debugging)
   executed_tool_calls: Annotation<ToolCall[]>({
-    reducer: toolCallsReducer,
+    reducer: appendReducer<ToolCall>,
     default: () => [],
   }),
 
@@ -217,7 +212,8 @@ export const AgentStateAnnotation = Annotation.Root({
   }),
 
   // Middleware metrics
-  middleware_metrics: Annotation<MiddlewareMetrics>({
+  // Nodes return only their own deltas; the reducer accumulates them
+  middleware_metrics: Annotation<MiddlewareMetrics, Partial<MiddlewareMetrics>>({
     reducer: metricsReducer,
     default: () => ({
       token_usage: { input: 0, output: 0, total: 0 },
@@ -231,7 +227,7 @@ export const AgentStateAnnotation = Annotation.Root({
 
   // Error tracking
   errors: Annotation<string[]>({
-    reducer: errorsReducer,
+    reducer: appendReducer<string>,
     default: () => [],
   }),
 
@@ -249,19 +245,13 @@ export const AgentStateAnnotation = Annotation.Root({
 
   // Sub-agent tasks for parallel execution
   subagent_tasks: Annotation<any[]>({
-    reducer: (current: any[], update: any[] | any) => {
-      const updates = Array.isArray(update) ? update : [update];
-      return [...current, ...updates];
-    },
+    reducer: appendReducer<any>,
     default: () => [],
   }),
 
   // Active sub-agent results
   subagent_results: Annotation<any[]>({
-    reducer: (current: any[], update: any[] | any) => {
-      const updates = Array.isArray(update) ? update : [update];
-      return [...current, ...updates];
-    },
+    reducer: appendReducer<any>,
     default: () => [],
   }),
 
@@ -277,6 +267,11 @@ export const AgentStateAnnotation = Annotation.Root({
  */
 export type AgentState = typeof AgentStateAnnotation.State;
 
+/**
+ * Update type accepted by the state reducers (e.g. partial middleware metrics).
+ */
+export type AgentStateUpdate = typeof AgentStateAnnotation.Update;
+
 /**
  * GraphNode utility typed to this state schema.
  */
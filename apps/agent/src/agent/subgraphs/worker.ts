@@ -1,7 +1,11 @@
 import { AIMessage, HumanMessage, ToolMessage } from "@langchain/core/messages";
 import { v4 as uuidv4 } from "uuid";
-import { agentConfig } from "../../lib/config.js";
-import { createRuntimeLLM } from "../../lib/llm.js";
+import {
+  bindToolsCached,
+  createRuntimeLLM,
+  getDefaultModelConfig,
+  MODEL_CALL_OPTIONS,
+} from "../../lib/llm.js";
 import type { SubAgentConfig, SubAgentResult } from "../state.js";
 import { toolMap } from "../tools/index.js";
 import { workerEventEmitter } from "./events.js";
@@ -10,7 +14,7 @@ import { workerEventEmitter } from "./events.js";
  * Get tools by name from the global tool map
  */
 function getToolsForNames(names: string[]) {
-  return names.map((name) => toolMap[name]).filter((tool) => tool !== undefined);
+  return names.map((name) => toolMap.get(name)).filter((tool) => tool !== undefined);
 }
 
 /**
@@ -20,8 +24,10 @@ function getToolsForNames(names: string[]) {
 export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult> {
   const startTime = Date.now();
 
-  console.log(`[Worker ${config.id}] Starting task: ${config.name}`);
-  console.log(`[Worker ${config.id}] Tools: ${config.tools.join(", ")}`);
+  console.log(
+    `[Worker ${config.id}] Starting task: ${config.name}\n` +
+      `[Worker ${config.id}] Tools: ${config.tools.join(", ")}`
+  );
 
   workerEventEmitter.emitWorkerStarted(config);
 
@@ -35,25 +41,7 @@ export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult>
       }, timeoutMs);
     });
 
-    const llm = await createRuntimeLLM(
-      config.modelConfig || {
-        provider: agentConfig.MODEL_PROVIDER as any,
-        modelName: agentConfig.MODEL_NAME,
-        apiKey:
-          agentConfig.MODEL_PROVIDER === "openai"
-            ? agentConfig.OPENAI_API_KEY
-            : agentConfig.MODEL_PROVIDER === "anthropic"
-              ? agentConfig.ANTHROPIC_API_KEY
-              : agentConfig.MODEL_PROVIDER === "google"
-                ? agentConfig.GOOGLE_API_KEY
-                : agentConfig.MODEL_PROVIDER === "groq"
-                  ? agentConfig.GROQ_API_KEY
-                  : agentConfig.MODEL_PROVIDER === "nvidia_nim"
-                    ? agentConfig.NVIDIA_NIM_API_KEY
-                    : undefined,
-        baseUrl: agentConfig.BASE_URL,
-      }
-    );
+    const llm = await createRuntimeLLM(config.modelConfig || getDefaultModelConfig());
 
     workerEventEmitter.emitWorkerProgress(
       config.id,
@@ -73,14 +61,14 @@ export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult>
     );
 
     // biome-ignore: LangChain LLM typing requires any here
-    const llmWithTools = (llm as any).bindTools ? (llm as any).bindTools(availableTools) : llm;
+    const llmWithTools = (llm as any).bindTools ? bindToolsCached(llm, availableTools) : llm;
 
     const systemMessage = new AIMessage({
       content: config.systemPrompt,
     });
 
     // biome-ignore: Messages typed as any for LangChain compatibility
-    let messages: any[] = [
+    const messages: any[] = [
       systemMessage,
       new HumanMessage({ content: config.context?.task_description || config.name }),
     ];
@@ -100,9 +88,11 @@ export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult>
           `Iteration ${iteration}/${maxIterations}`
         );
 
-        const response = await llmWithTools.invoke(messages);
+        // Hand the model a snapshot: tracers may hold on to the input list, and
+        // the working list keeps growing in place below
+        const response = await llmWithTools.invoke(messages.slice(), MODEL_CALL_OPTIONS);
 
-        messages = [...messages, response];
+        messages.push(response);
 
         if (!response.tool_calls || response.tool_calls.length === 0) {
           console.log(`[Worker ${config.id}] No more tool calls, finishing.`);
@@ -122,18 +112,17 @@ export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult>
             }
           );
 
-          const tool = toolMap[toolCall.name];
+          const tool = toolMap.get(toolCall.name);
           if (!tool) {
             const errorMsg = `Tool not found: ${toolCall.name}`;
             console.error(`[Worker ${config.id}] ${errorMsg}`);
-            messages = [
-              ...messages,
+            messages.push(
               new ToolMessage({
                 content: errorMsg,
                 tool_call_id: toolCall.id,
                 name: toolCall.name,
-              }),
-            ];
+              })
+            );
             continue;
           }
 
@@ -143,14 +132,13 @@ export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult>
             const result = await (tool as any).invoke(args);
 
             const resultStr = typeof result === "string" ? result : JSON.stringify(result);
-            messages = [
-              ...messages,
+            messages.push(
               new ToolMessage({
                 content: resultStr,
                 tool_call_id: toolCall.id,
                 name: toolCall.name,
-              }),
-            ];
+              })
+            );
 
             workerEventEmitter.emitWorkerProgress(
               config.id,
@@ -161,14 +149,13 @@ export async function runWorker(config: SubAgentConfig): Promise<SubAgentResult>
           } catch (toolError) {
             const errorMsg = toolError instanceof Error ? toolError.message : String(toolError);
             console.error(`[Worker ${config.id}] Tool error: ${errorMsg}`);
-            messages = [
-              ...messages,
+            messages.push(
               new ToolMessage({
                 content: `Error: ${errorMsg}`,
                 tool_call_id: toolCall.id,
                 name: toolCall.name,
-              }),
-            ];
+              })
+            );
           }
         }
       }
@@ -240,6 +227,34 @@ export function createWorkerConfig(
   };
 }
 
+/**
+ * Emit the batch completion event, building the per-worker events and the
+ * success/failure tallies in a single pass over the results
+ */
+function emitAllWorkersCompleted(results: SubAgentResult[]): void {
+  const timestamp = Date.now();
+  let successCount = 0;
+  let failureCount = 0;
+
+  const completedEvents = results.map((result) => {
+    if (result.status === "success") successCount++;
+    else if (result.status === "failure") failureCount++;
+
+    return {
+      type: "worker_completed" as const,
+      task_id: result.task_id,
+      name: result.task_id,
+      status: result.status,
+      output: result.output,
+      errors: result.errors,
+      execution_time_ms: result.metrics?.execution_time_ms,
+      timestamp,
+    };
+  });
+
+  workerEventEmitter.emitAllWorkersCompleted(completedEvents, successCount, failureCount);
+}
+
 /**
  * Spawn multiple workers and run them in parallel
  */
@@ -252,21 +267,7 @@ export async function spawnWorkers(configs: SubAgentConfig[]): Promise<SubAgentR
 
   console.log(`[SubAgentManager] All ${results.length} workers completed`);
 
-  const completedEvents = results.map((result) => ({
-    type: "worker_completed" as const,
-    task_id: result.task_id,
-    name: result.task_id,
-    status: result.status,
-    output: result.output,
-    errors: result.errors,
-    execution_time_ms: result.metrics?.execution_time_ms,
-    timestamp: Date.now(),
-  }));
-
-  const successCount = results.filter((r) => r.status === "success").length;
-  const failureCount = results.filter((r) => r.status === "failure").length;
-
-  workerEventEmitter.emitAllWorkersCompleted(completedEvents, successCount, failureCount);
+  emitAllWorkersCompleted(results);
 
   return results;
 }
@@ -292,21 +293,7 @@ export async function runWorkersSequentially(configs: SubAgentConfig[]): Promise
 
   console.log(`[SubAgentManager] All ${results.length} workers completed`);
 
-  const completedEvents = results.map((result) => ({
-    type: "worker_completed" as const,
-    task_id: result.task_id,
-    name: result.task_id,
-    status: result.status,
-    output: result.output,
-    errors: result.errors,
-    execution_time_ms: result.metrics?.execution_time_ms,
-    timestamp: Date.now(),
-  }));
-
-  const successCount = results.filter((r) => r.status === "success").length;
-  const failureCount = results.filter((r) => r.status === "failure").length;
-
-  workerEventEmitter.emitAllWorkersCompleted(completedEvents, successCount, failureCount);
+  emitAllWorkersCompleted(results);
 
   return results;
 }
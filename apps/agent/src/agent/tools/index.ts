@@ -83,20 +83,41 @@ interface ShellResult {
 
 import { tool } from "@langchain/core/tools";
 
+/**
+ * Per-stream character budget for shell output returned to the model. Long
+ * outputs (logs, builds, test runs) keep their head and their tail, where the
+ * final status and errors usually are, instead of the whole (up to 1 MB) dump.
+ */
+const SHELL_OUTPUT_HEAD_CHARS = 4_000;
+const SHELL_OUTPUT_TAIL_CHARS = 8_000;
+
+function truncateMiddle(text: string): { text: string; truncated: boolean } {
+  if (text.length <= SHELL_OUTPUT_HEAD_CHARS + SHELL_OUTPUT_TAIL_CHARS) {
+    return { text, truncated: false };
+  }
+  const omitted = text.length - SHELL_OUTPUT_HEAD_CHARS - SHELL_OUTPUT_TAIL_CHARS;
+  return {
+    text: `${text.slice(0, SHELL_OUTPUT_HEAD_CHARS)}\n\n... [${omitted} characters truncated] ...\n\n${text.slice(-SHELL_OUTPUT_TAIL_CHARS)}`,
+    truncated: true,
+  };
+}
+
 export const shellTool = tool(
   async ({ command }: { command: string }) => {
     try {
       const result = await shellExecutor.execute(command);
+      const stdout = truncateMiddle(result.stdout);
+      const stderr = truncateMiddle(result.stderr);
 
       const shellResult: ShellResult = {
         command: result.command,
-        stdout: result.stdout,
-        stderr: result.stderr,
+        stdout: stdout.text,
+        stderr: stderr.text,
         exitCode: result.exitCode,
         success: result.success,
         duration: result.duration,
         cwd: result.cwd,
-        truncated: result.truncated,
+        truncated: result.truncated || stdout.truncated || stderr.truncated,
       };
 
       return JSON.stringify(shellResult);
@@ -131,4 +152,12 @@ export const tools = [
   presentArtifactTool,
   spawnSubagentsTool,
 ];
-export const toolMap = Object.fromEntries(tools.map((t) => [t.name, t]));
+
+/**
+ * Name -> tool registry, built once at import. A Map (rather than a plain
+ * object) keeps lookups of arbitrary model-supplied names like "constructor"
+ * from resolving to prototype members.
+ */
+export const toolMap: ReadonlyMap<string, (typeof tools)[number]> = new Map(
+  tools.map((t) => [t.name, t])
+);
@@ -43,24 +43,32 @@ export const spawnSubagentsTool = tool(
       results = await spawnWorkers(configs);
     }
 
+    // Each config carries its worker's name, so one id index replaces the
+    // nested workers/configs scans per result
+    const nameById = new Map(configs.map((c) => [c.id, c.name]));
+
     const summary = results.map((r) => ({
       task_id: r.task_id,
-      name:
-        workers.find(
-          (w) => w.id === r.task_id || w.name === configs.find((c) => c.id === r.task_id)?.name
-        )?.name || r.task_id,
+      name: nameById.get(r.task_id) || r.task_id,
       status: r.status,
       output: r.output.slice(0, 500) + (r.output.length > 500 ? "..." : ""),
       execution_time_ms: r.metrics?.execution_time_ms,
       errors: r.errors,
     }));
 
-    const allSucceeded = results.every((r) => r.status === "success");
-    const anyFailed = results.some((r) => r.status === "failure");
+    let succeeded = 0;
+    let failed = 0;
+    for (const r of results) {
+      if (r.status === "success") succeeded++;
+      else if (r.status === "failure") failed++;
+    }
+
+    const allSucceeded = succeeded === results.length;
+    const anyFailed = failed > 0;
 
     return JSON.stringify({
       success: allSucceeded,
-      summary: `Completed ${results.length} sub-agents: ${results.filter((r) => r.status === "success").length} succeeded, ${results.filter((r) => r.status === "failure").length} failed`,
+      summary: `Completed ${results.length} sub-agents: ${succeeded} succeeded, ${failed} failed`,
       results: summary,
       all_results: results,
       message: anyFailed
@@ -37,13 +37,12 @@ function getDbPath(): string {
 // Load or initialize database
 function loadDb(): Database {
   try {
-    const dbPath = getDbPath();
-    if (fs.existsSync(dbPath)) {
-      const data = fs.readFileSync(dbPath, "utf-8");
-      return JSON.parse(data);
-    }
+    const data = fs.readFileSync(getDbPath(), "utf-8");
+    return JSON.parse(data);
   } catch (error) {
-    console.error("Error loading assistants database:", error);
+    if ((error as NodeJS.ErrnoException).code !== "ENOENT") {
+      console.error("Error loading assistants database:", error);
+    }
   }
   return { assistants: [] };
 }
@@ -57,10 +57,12 @@ class ThreadMetadataStore {
 
   private load() {
     try {
-      if (fs.existsSync(this.filePath)) {
-        this.threads = JSON.parse(fs.readFileSync(this.filePath, "utf-8"));
-      }
+      this.threads = JSON.parse(fs.readFileSync(this.filePath, "utf-8"));
     } catch (e) {
+      // Nothing persisted yet — keep the in-memory state
+      if ((e as NodeJS.ErrnoException).code === "ENOENT") {
+        return;
+      }
       console.error("[ThreadMetadataStore] Failed to load:", e);
       this.threads = {};
     }
@@ -132,8 +134,11 @@ class ThreadMetadataStore {
       });
     }
 
-    // Sort by updated_at descending (most recent first)
-    results.sort((a, b) => new Date(b.updated_at).getTime() - new Date(a.updated_at).getTime());
+    // Sort by updated_at descending (most recent first). The timestamps are all
+    // toISOString() output, which orders lexically, so no Date parsing is needed
+    results.sort((a, b) =>
+      a.updated_at < b.updated_at ? 1 : a.updated_at > b.updated_at ? -1 : 0
+    );
 
     return results.slice(offset, offset + limit);
   }
@@ -145,13 +150,14 @@ class ThreadMetadataStore {
    */
   syncFromCheckpointer(threadIds: string[]) {
     this.load();
+    const now = new Date().toISOString();
     let dirty = false;
     for (const id of threadIds) {
       if (!this.threads[id]) {
         this.threads[id] = {
           thread_id: id,
-          created_at: new Date().toISOString(),
-          updated_at: new Date().toISOString(),
+          created_at: now,
+          updated_at: now,
           metadata: {},
           status: "idle",
         };
@@ -198,23 +204,27 @@ app.use(
   })
 );
 
-app.get("/health", (c) =>
-  c.json({
-    status: "healthy",
-    service: "backend-ts",
-    version: "enhanced-v2.0",
-    features: {
-      reasoning: true,
-      human_in_the_loop: true,
-      tool_approval: true,
-      rate_limiting: agentConfig.ENABLE_RATE_LIMITING,
-      token_tracking: agentConfig.ENABLE_TOKEN_TRACKING,
-      pii_detection: agentConfig.ENABLE_PII_DETECTION,
-      tool_retry: agentConfig.ENABLE_TOOL_RETRY,
-    },
-    tool_categories: TOOL_CATEGORIES,
-  })
-);
+// Health and config payloads only depend on env config and the static tool
+// list, so they are serialized once at startup and served as-is
+const JSON_HEADERS = { "Content-Type": "application/json; charset=UTF-8" } as const;
+
+const HEALTH_BODY = JSON.stringify({
+  status: "healthy",
+  service: "backend-ts",
+  version: "enhanced-v2.0",
+  features: {
+    reasoning: true,
+    human_in_the_loop: true,
+    tool_approval: true,
+    rate_limiting: agentConfig.ENABLE_RATE_LIMITING,
+    token_tracking: agentConfig.ENABLE_TOKEN_TRACKING,
+    pii_detection: agentConfig.ENABLE_PII_DETECTION,
+    tool_retry: agentConfig.ENABLE_TOOL_RETRY,
+  },
+  tool_categories: TOOL_CATEGORIES,
+});
+
+app.get("/health", (c) => c.body(HEALTH_BODY, 200, JSON_HEADERS));
 
 app.get("/workers/events", (c) => {
   let eventCount = 0;
@@ -283,10 +293,11 @@ app.get("/threads/:threadId", async (c) => {
     return c.json(created);
   }
   // Return a synthetic thread so the SDK doesn't crash
+  const now = new Date().toISOString();
   return c.json({
     thread_id: threadId,
-    created_at: new Date().toISOString(),
-    updated_at: new Date().toISOString(),
+    created_at: now,
+    updated_at: now,
     metadata: {},
     status: "idle",
   });
@@ -458,6 +469,17 @@ function getDefaultToolApprovalConfig(): ToolApprovalConfig {
   };
 }
 
+// Stream mode tables used to normalize SDK stream_mode values (see below)
+const PLATFORM_TO_LGJS: ReadonlyMap<string, string> = new Map([["messages-tuple", "messages"]]);
+const VALID_LGJS_MODES: ReadonlySet<string> = new Set([
+  "values",
+  "updates",
+  "messages",
+  "debug",
+  "custom",
+]);
+const DEFAULT_STREAM_MODES = ["updates", "messages", "custom"];
+
 app.post("/threads/:threadId/runs/stream", async (c) => {
   const threadId = c.req.param("threadId");
   const body = await c.req.json();
@@ -472,20 +494,15 @@ app.post("/threads/:threadId/runs/stream", async (c) => {
   // Also always include "values" so the SDK's setStreamValues() gets called,
   // which populates stream.values.messages — required for renders to show messages.
   // ---------------------------------------------------------------------------
-  const PLATFORM_TO_LGJS: Record<string, string> = {
-    "messages-tuple": "messages",
-  };
-  const VALID_LGJS_MODES = new Set(["values", "updates", "messages", "debug", "custom"]);
-
   const requestedModes: string[] = Array.isArray(body.stream_mode)
     ? body.stream_mode
     : body.stream_mode
       ? [body.stream_mode]
-      : ["updates", "messages", "custom"];
+      : DEFAULT_STREAM_MODES;
 
   const normalizedModeSet = new Set<string>();
   for (const m of requestedModes) {
-    const mapped = PLATFORM_TO_LGJS[m] ?? m;
+    const mapped = PLATFORM_TO_LGJS.get(m) ?? m;
     if (VALID_LGJS_MODES.has(mapped)) normalizedModeSet.add(mapped);
   }
   // Always include "values" — this is what the SDK uses to render messages
@@ -829,29 +846,29 @@ app.post("/ollama/pull", async (c) => {
   });
 });
 
-app.get("/config", (c) => {
-  return c.json({
-    model_provider: agentConfig.MODEL_PROVIDER,
-    model_name: agentConfig.MODEL_NAME,
-    features: {
-      reasoning: true,
-      human_in_the_loop: true,
-      tool_approval: true,
-      rate_limiting: agentConfig.ENABLE_RATE_LIMITING,
-      token_tracking: agentConfig.ENABLE_TOKEN_TRACKING,
-      pii_detection: agentConfig.ENABLE_PII_DETECTION,
-      tool_retry: agentConfig.ENABLE_TOOL_RETRY,
-      assistants: true,
-    },
-    limits: {
-      max_model_calls: agentConfig.MAX_MODEL_CALLS,
-      max_tool_calls: agentConfig.MAX_TOOL_CALLS,
-      max_retries: agentConfig.MAX_RETRIES,
-    },
-    tool_categories: TOOL_CATEGORIES,
-  });
+const CONFIG_BODY = JSON.stringify({
+  model_provider: agentConfig.MODEL_PROVIDER,
+  model_name: agentConfig.MODEL_NAME,
+  features: {
+    reasoning: true,
+    human_in_the_loop: true,
+    tool_approval: true,
+    rate_limiting: agentConfig.ENABLE_RATE_LIMITING,
+    token_tracking: agentConfig.ENABLE_TOKEN_TRACKING,
+    pii_detection: agentConfig.ENABLE_PII_DETECTION,
+    tool_retry: agentConfig.ENABLE_TOOL_RETRY,
+    assistants: true,
+  },
+  limits: {
+    max_model_calls: agentConfig.MAX_MODEL_CALLS,
+    max_tool_calls: agentConfig.MAX_TOOL_CALLS,
+    max_retries: agentConfig.MAX_RETRIES,
+  },
+  tool_categories: TOOL_CATEGORIES,
 });
 
+app.get("/config", (c) => c.body(CONFIG_BODY, 200, JSON_HEADERS));
+
 app.use("/assistants/*", async (c, next) => {
   c.set("db", { assistants: assistantsDb });
   await next();
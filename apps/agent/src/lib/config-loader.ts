@@ -12,7 +12,7 @@
  * 8. Default fallback values
  */
 
-import { copyFileSync, existsSync, mkdirSync, readFileSync } from "node:fs";
+import { copyFileSync, existsSync, mkdirSync, readdirSync, readFileSync, statSync } from "node:fs";
 import { homedir } from "node:os";
 import { dirname, join, parse, resolve } from "node:path";
 import { getGlobalDataDir } from "@horizon/shared-utils";
@@ -75,21 +75,50 @@ export const DEFAULT_CONFIG: HorizonConfig = {
 /**
  * Monorepo root markers
  */
-const MONOREPO_MARKERS = ["pnpm-workspace.yaml", "turbo.json", "lerna.json"];
+const MONOREPO_MARKERS: ReadonlySet<string> = new Set([
+  "pnpm-workspace.yaml",
+  "turbo.json",
+  "lerna.json",
+]);
+
+/**
+ * Monorepo root lookups keyed by start directory
+ */
+const monorepoRootCache = new Map<string, string | null>();
+
+/**
+ * Check whether a directory contains any monorepo marker, using a single
+ * directory listing instead of probing each marker path separately
+ */
+function hasMonorepoMarker(dir: string): boolean {
+  try {
+    return readdirSync(dir).some((entry) => MONOREPO_MARKERS.has(entry));
+  } catch {
+    return false;
+  }
+}
 
 /**
  * Find monorepo root directory by looking for marker files
  */
 function findMonorepoRoot(startDir: string): string | null {
+  const cached = monorepoRootCache.get(startDir);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const found = searchMonorepoRoot(startDir);
+  monorepoRootCache.set(startDir, found);
+  return found;
+}
+
+function searchMonorepoRoot(startDir: string): string | null {
   let currentDir = startDir;
   const root = parse(currentDir).root;
 
   while (currentDir !== root) {
-    for (const marker of MONOREPO_MARKERS) {
-      const markerPath = join(currentDir, marker);
-      if (existsSync(markerPath)) {
-        return currentDir;
-      }
+    if (hasMonorepoMarker(currentDir)) {
+      return currentDir;
     }
 
     const parentDir = dirname(currentDir);
@@ -151,15 +180,36 @@ function expandTilde(filepath: string): string {
   return filepath;
 }
 
+/**
+ * Last resolved workspace path and the inputs it was resolved from
+ */
+let _resolvedWorkspace: {
+  envPath: string | undefined;
+  config: HorizonConfig;
+  path: string;
+} | null = null;
+
 /**
  * Resolve workspace path with fallback chain
+ *
+ * The result is memoized per (WORKSPACE_PATH, config) so repeated callers
+ * (tools, server startup) skip the env lookup, logging and directory check.
  */
 export function resolveWorkspacePath(config: HorizonConfig): string {
+  const envPath = process.env.WORKSPACE_PATH;
+  if (
+    _resolvedWorkspace &&
+    _resolvedWorkspace.envPath === envPath &&
+    _resolvedWorkspace.config === config
+  ) {
+    return _resolvedWorkspace.path;
+  }
+
   let workspacePath: string;
 
   // 1. Check WORKSPACE_PATH environment variable
-  if (process.env.WORKSPACE_PATH) {
-    workspacePath = resolve(expandTilde(process.env.WORKSPACE_PATH));
+  if (envPath) {
+    workspacePath = resolve(expandTilde(envPath));
     console.log(`[Config] Using WORKSPACE_PATH: ${workspacePath}`);
   }
   // 2. Check config file defaultPath
@@ -183,6 +233,7 @@ export function resolveWorkspacePath(config: HorizonConfig): string {
     }
   }
 
+  _resolvedWorkspace = { envPath, config, path: workspacePath };
   return workspacePath;
 }
 
@@ -211,11 +262,26 @@ function getUserConfigPath(): string | null {
 
 // getSystemConfigPath removed as it is no longer used
 
+/**
+ * Parsed config files keyed by path. An entry is reused only while the
+ * file's mtime and size are unchanged, so edits are still picked up.
+ */
+const parsedConfigFiles = new Map<
+  string,
+  { mtimeMs: number; size: number; config: HorizonConfig }
+>();
+
 /**
  * Load and parse configuration file
  */
 function loadConfigFile(configPath: string): HorizonConfig | null {
   try {
+    const { mtimeMs, size } = statSync(configPath);
+    const cached = parsedConfigFiles.get(configPath);
+    if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+      return cached.config;
+    }
+
     const content = readFileSync(configPath, "utf-8");
     const parsed = JSON.parse(content);
     const result = HorizonConfigSchema.safeParse(parsed);
@@ -225,6 +291,7 @@ function loadConfigFile(configPath: string): HorizonConfig | null {
       return null;
     }
 
+    parsedConfigFiles.set(configPath, { mtimeMs, size, config: result.data });
     console.log(`[Config] Loaded configuration from: ${configPath}`);
     return result.data;
   } catch (error) {
@@ -245,8 +312,9 @@ function loadConfigFile(configPath: string): HorizonConfig | null {
  */
 export function loadHorizonConfig(): HorizonConfig {
   // 1. Check HORIZON_CONFIG environment variable
-  if (process.env.HORIZON_CONFIG) {
-    const configPath = resolve(process.env.HORIZON_CONFIG);
+  const explicitPath = process.env.HORIZON_CONFIG;
+  if (explicitPath) {
+    const configPath = resolve(explicitPath);
     if (existsSync(configPath)) {
       const config = loadConfigFile(configPath);
       if (config) {
@@ -317,4 +385,5 @@ export function getHorizonConfig(): HorizonConfig {
  */
 export function resetConfigCache(): void {
   _cachedConfig = null;
+  _resolvedWorkspace = null;
 }
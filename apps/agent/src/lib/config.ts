@@ -4,8 +4,16 @@ import { z } from "zod";
 // Load environment variables
 config();
 
+// Shared env-string converters, so every flag/limit reuses the same transform
+const toBoolean = (s: string) => s === "true";
+
+const envBoolean = (defaultValue: "true" | "false") =>
+  z.string().default(defaultValue).transform(toBoolean);
+
+const envNumber = (defaultValue: string) => z.string().default(defaultValue).transform(Number);
+
 const EnvSchema = z.object({
-  PORT: z.string().default("2024").transform(Number),
+  PORT: envNumber("2024"),
   ENVIRONMENT: z.enum(["development", "production"]).default("development"),
   API_KEY: z.string().optional(),
 
@@ -14,8 +22,8 @@ const EnvSchema = z.object({
     .enum(["openai", "anthropic", "google", "ollama", "groq", "nvidia_nim"])
     .default("nvidia_nim"),
   MODEL_NAME: z.string().default("z-ai/glm5"),
-  TEMPERATURE: z.string().default("0.7").transform(Number),
-  MAX_TOKENS: z.string().default("16384").transform(Number),
+  TEMPERATURE: envNumber("0.7"),
+  MAX_TOKENS: envNumber("16384"),
   BASE_URL: z.string().optional(),
   OLLAMA_BASE_URL: z.string().default("http://localhost:11434"),
 
@@ -27,57 +35,32 @@ const EnvSchema = z.object({
   NVIDIA_NIM_API_KEY: z.string().optional(),
 
   // Feature Flags (Middleware)
-  ENABLE_MEMORY: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_SUMMARIZATION: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_PII_DETECTION: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_RATE_LIMITING: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_TOKEN_TRACKING: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_MODEL_FALLBACK: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_TOOL_RETRY: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_TOOL_APPROVAL: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_TODO_LIST: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
-  ENABLE_TODO_PLANNER: z
-    .string()
-    .default("true")
-    .transform((s) => s === "true"),
+  ENABLE_MEMORY: envBoolean("true"),
+  ENABLE_SUMMARIZATION: envBoolean("true"),
+  ENABLE_PII_DETECTION: envBoolean("true"),
+  ENABLE_RATE_LIMITING: envBoolean("true"),
+  ENABLE_TOKEN_TRACKING: envBoolean("true"),
+  ENABLE_MODEL_FALLBACK: envBoolean("true"),
+  ENABLE_TOOL_RETRY: envBoolean("true"),
+  ENABLE_TOOL_APPROVAL: envBoolean("true"),
+  ENABLE_TODO_LIST: envBoolean("true"),
+  ENABLE_TODO_PLANNER: envBoolean("true"),
 
   // Limits
-  MAX_MODEL_CALLS: z.string().default("10").transform(Number),
-  MAX_TOOL_CALLS: z.string().default("20").transform(Number),
-  SUMMARIZATION_THRESHOLD: z.string().default("135000").transform(Number),
-  RATE_LIMIT_WINDOW: z.string().default("60").transform(Number),
+  MAX_MODEL_CALLS: envNumber("10"),
+  MAX_TOOL_CALLS: envNumber("20"),
+  SUMMARIZATION_THRESHOLD: envNumber("135000"),
+  RATE_LIMIT_WINDOW: envNumber("60"),
+
+  // LLM response cache ("memory" caches deterministic, temperature 0 calls)
+  LLM_CACHE_BACKEND: z.enum(["none", "memory"]).default("none"),
 
   // Retry Settings
-  MAX_RETRIES: z.string().default("3").transform(Number),
-  BACKOFF_FACTOR: z.string().default("2.0").transform(Number),
-  INITIAL_DELAY: z.string().default("1.0").transform(Number),
+  MAX_RETRIES: envNumber("3"),
+  BACKOFF_FACTOR: envNumber("2.0"),
+  INITIAL_DELAY: envNumber("1.0"),
+  // Upper bound in seconds for a single model call, including provider retries (0 disables)
+  MODEL_TIMEOUT: envNumber("300"),
 
   // Prompts
   CHARACTER: z.string().default("You are a helpful AI assistant."),
@@ -1,11 +1,47 @@
-import { ChatAnthropic } from "@langchain/anthropic";
-import type { BaseChatModel } from "@langchain/core/language_models/chat_models";
-import { ChatGoogleGenerativeAI } from "@langchain/google-genai";
-import { ChatGroq } from "@langchain/groq";
-import { ChatOllama } from "@langchain/ollama";
+import { type BaseCache, InMemoryCache } from "@langchain/core/caches";
+import type { BaseLanguageModelInput } from "@langchain/core/language_models/base";
+import type {
+  BaseChatModel,
+  BaseChatModelCallOptions,
+  BindToolsInput,
+} from "@langchain/core/language_models/chat_models";
+import type { AIMessageChunk } from "@langchain/core/messages";
+import type { Runnable } from "@langchain/core/runnables";
 import { ChatOpenAI } from "@langchain/openai";
 import { type AgentConfig, agentConfig } from "./config.js";
 
+/**
+ * Memoize a dynamic import. The module is loaded on first call and the same
+ * promise is returned afterwards; a failed load is retried on the next call.
+ */
+function lazyImport<T>(load: () => Promise<T>): () => Promise<T> {
+  let loaded: Promise<T> | null = null;
+  return () => {
+    if (!loaded) {
+      loaded = load();
+      loaded.catch(() => {
+        loaded = null;
+      });
+    }
+    return loaded;
+  };
+}
+
+// OpenAI (also used for NVIDIA NIM) is imported eagerly; the other provider
+// SDKs are only loaded once a model for that provider is actually requested.
+const loadAnthropic = lazyImport(() => import("@langchain/anthropic"));
+const loadGoogleGenAI = lazyImport(() => import("@langchain/google-genai"));
+const loadGroq = lazyImport(() => import("@langchain/groq"));
+const loadOllama = lazyImport(() => import("@langchain/ollama"));
+
+/**
+ * Call options applied to every model invocation. The timeout aborts a hung
+ * provider connection instead of leaving the run (and its HTTP socket) waiting
+ * indefinitely; it surfaces as an error like any other failed call.
+ */
+export const MODEL_CALL_OPTIONS: { timeout?: number } =
+  agentConfig.MODEL_TIMEOUT > 0 ? { timeout: agentConfig.MODEL_TIMEOUT * 1000 } : {};
+
 export interface RuntimeModelConfig {
   provider: "openai" | "anthropic" | "google" | "ollama" | "groq" | "nvidia_nim";
   modelName: string;
@@ -18,33 +54,131 @@ export interface RuntimeModelConfig {
   thinkingBudget?: number;
 }
 
+/**
+ * Maps each provider to the env config key holding its API key.
+ * Ollama runs locally and has no key.
+ */
+const PROVIDER_API_KEYS: Record<RuntimeModelConfig["provider"], keyof AgentConfig | undefined> = {
+  openai: "OPENAI_API_KEY",
+  anthropic: "ANTHROPIC_API_KEY",
+  google: "GOOGLE_API_KEY",
+  groq: "GROQ_API_KEY",
+  nvidia_nim: "NVIDIA_NIM_API_KEY",
+  ollama: undefined,
+};
+
+/**
+ * Resolve the configured API key for a provider from the env config.
+ */
+export function getProviderApiKey(
+  provider: string,
+  config: AgentConfig = agentConfig
+): string | undefined {
+  const key = PROVIDER_API_KEYS[provider as RuntimeModelConfig["provider"]];
+  return key ? (config[key] as string | undefined) : undefined;
+}
+
+function toRuntimeModelConfig(config: AgentConfig): RuntimeModelConfig {
+  return {
+    provider: config.MODEL_PROVIDER,
+    modelName: config.MODEL_NAME,
+    temperature: config.TEMPERATURE,
+    maxTokens: config.MAX_TOKENS,
+    baseUrl: config.BASE_URL,
+    apiKey: getProviderApiKey(config.MODEL_PROVIDER, config),
+  };
+}
+
+let defaultModelConfig: RuntimeModelConfig | null = null;
+
+/**
+ * Runtime model config for the env-configured default model, resolved once.
+ * Shared by the main agent and sub-agent workers.
+ */
+export function getDefaultModelConfig(): RuntimeModelConfig {
+  if (!defaultModelConfig) {
+    defaultModelConfig = toRuntimeModelConfig(agentConfig);
+  }
+  return defaultModelConfig;
+}
+
 export async function createLLM(config: AgentConfig = agentConfig): Promise<BaseChatModel> {
-  const { MODEL_PROVIDER, MODEL_NAME, TEMPERATURE, MAX_TOKENS, BASE_URL } = config;
-
-  console.log(`[LLM] Initializing ${MODEL_PROVIDER} model: ${MODEL_NAME}`);
-
-  return createRuntimeLLM({
-    provider: MODEL_PROVIDER as RuntimeModelConfig["provider"],
-    modelName: MODEL_NAME,
-    temperature: TEMPERATURE,
-    maxTokens: MAX_TOKENS,
-    baseUrl: BASE_URL,
-    apiKey:
-      config.MODEL_PROVIDER === "openai"
-        ? config.OPENAI_API_KEY
-        : config.MODEL_PROVIDER === "anthropic"
-          ? config.ANTHROPIC_API_KEY
-          : config.MODEL_PROVIDER === "google"
-            ? config.GOOGLE_API_KEY
-            : config.MODEL_PROVIDER === "groq"
-              ? config.GROQ_API_KEY
-              : config.MODEL_PROVIDER === "nvidia_nim"
-                ? config.NVIDIA_NIM_API_KEY
-                : undefined,
-  });
+  return createRuntimeLLM(
+    config === agentConfig ? getDefaultModelConfig() : toRuntimeModelConfig(config)
+  );
+}
+
+/**
+ * Chat model instances keyed by their full runtime config. Model clients
+ * hold their own HTTP client and auth state, so building one per agent turn
+ * (or per worker) is wasted work when the settings are identical.
+ */
+const MAX_CACHED_LLMS = 16;
+const llmCache = new Map<string, Promise<BaseChatModel>>();
+
+function llmCacheKey(config: RuntimeModelConfig): string {
+  return JSON.stringify([
+    config.provider,
+    config.modelName,
+    config.temperature,
+    config.maxTokens,
+    config.apiKey,
+    config.baseUrl,
+    config.enableReasoning,
+    config.reasoningEffort,
+    config.thinkingBudget,
+  ]);
+}
+
+let responseCache: BaseCache | null = null;
+
+/**
+ * Shared response cache for deterministic calls, selected by LLM_CACHE_BACKEND.
+ * Only temperature 0 (non-reasoning) models use it: sampled responses are
+ * expected to differ between calls, so serving them from a cache would change
+ * behaviour rather than just skip a round-trip.
+ */
+function getResponseCache(temperature: number, enableReasoning: boolean): BaseCache | undefined {
+  if (agentConfig.LLM_CACHE_BACKEND === "none" || temperature !== 0 || enableReasoning) {
+    return undefined;
+  }
+  if (!responseCache) {
+    responseCache = new InMemoryCache();
+    console.log(`[LLM] Response cache enabled (${agentConfig.LLM_CACHE_BACKEND})`);
+  }
+  return responseCache;
+}
+
+/**
+ * Drop all cached chat model instances (e.g. after rotating API keys)
+ */
+export function resetLLMCache(): void {
+  llmCache.clear();
+}
+
+export function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promise<BaseChatModel> {
+  const key = llmCacheKey(runtimeConfig);
+  const cached = llmCache.get(key);
+  if (cached) {
+    return cached;
+  }
+
+  if (llmCache.size >= MAX_CACHED_LLMS) {
+    // Map preserves insertion order, so the first key is the oldest entry
+    const oldest = llmCache.keys().next().value;
+    if (oldest !== undefined) {
+      llmCache.delete(oldest);
+    }
+  }
+
+  const llm = buildRuntimeLLM(runtimeConfig);
+  llmCache.set(key, llm);
+  // Don't keep failed constructions (e.g. missing API key) around
+  llm.catch(() => llmCache.delete(key));
+  return llm;
 }
 
-export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promise<BaseChatModel> {
+async function buildRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promise<BaseChatModel> {
   const {
     provider,
     modelName,
@@ -57,9 +191,10 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
     thinkingBudget,
   } = runtimeConfig;
 
-  console.log(
-    `[LLM] Creating runtime LLM: ${provider}/${modelName} (reasoning: ${enableReasoning})`
-  );
+  // Logged once per constructed client; cached instances are reused silently
+  console.log(`[LLM] Initializing ${provider}/${modelName} (reasoning: ${enableReasoning})`);
+
+  const cache = getResponseCache(temperature, enableReasoning);
 
   switch (provider) {
     case "openai": {
@@ -71,6 +206,7 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
         temperature: enableReasoning ? undefined : temperature,
         maxTokens: enableReasoning ? undefined : maxTokens,
         openAIApiKey: apiKey,
+        cache,
         configuration: {
           baseURL: baseUrl,
         },
@@ -85,10 +221,12 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
       if (!apiKey) {
         throw new Error("ANTHROPIC_API_KEY is required for Anthropic provider");
       }
+      const { ChatAnthropic } = await loadAnthropic();
       return new ChatAnthropic({
         modelName,
         temperature: enableReasoning ? undefined : temperature,
         anthropicApiKey: apiKey,
+        cache,
         thinking: enableReasoning
           ? { type: "enabled", budget_tokens: thinkingBudget || 1024 }
           : undefined,
@@ -99,19 +237,23 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
       if (!apiKey) {
         throw new Error("GOOGLE_API_KEY is required for Google provider");
       }
+      const { ChatGoogleGenerativeAI } = await loadGoogleGenAI();
       return new ChatGoogleGenerativeAI({
         model: modelName,
         temperature,
         maxOutputTokens: maxTokens,
         apiKey,
+        cache,
       });
     }
 
     case "ollama": {
+      const { ChatOllama } = await loadOllama();
       return new ChatOllama({
         model: modelName,
         temperature: enableReasoning ? undefined : temperature,
         baseUrl: baseUrl || "http://localhost:11434",
+        cache,
       });
     }
 
@@ -119,10 +261,12 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
       if (!apiKey) {
         throw new Error("GROQ_API_KEY is required for Groq provider");
       }
+      const { ChatGroq } = await loadGroq();
       return new ChatGroq({
         model: modelName,
         temperature,
         apiKey,
+        cache,
       });
     }
 
@@ -135,13 +279,13 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
       const extraBody = enableReasoning
         ? { chat_template_kwargs: { enable_thinking: true, clear_thinking: false } }
         : undefined;
-      console.log(`[LLM] NVIDIA NIM extraBody:`, extraBody);
 
       const chatModel = new ChatOpenAI({
         modelName,
         temperature,
         maxTokens,
         openAIApiKey: apiKey,
+        cache,
         configuration: {
           baseURL: baseUrl || "https://integrate.api.nvidia.com/v1",
           defaultHeaders: {
@@ -162,3 +306,43 @@ export async function createRuntimeLLM(runtimeConfig: RuntimeModelConfig): Promi
       throw new Error(`Unsupported model provider: ${provider}`);
   }
 }
+
+/**
+ * Tool-bound runnables per model instance, keyed by tool set and call options.
+ * Chat models are reused across turns and workers (see createRuntimeLLM), and
+ * bindTools() converts every tool's zod schema to JSON Schema, so each
+ * model/tool-set pair only pays that conversion once.
+ */
+const boundModels = new WeakMap<
+  BaseChatModel,
+  Map<string, Runnable<BaseLanguageModelInput, AIMessageChunk>>
+>();
+
+export function bindToolsCached(
+  llm: BaseChatModel,
+  tools: Array<BindToolsInput & { name: string }>,
+  options?: Record<string, unknown>
+): Runnable<BaseLanguageModelInput, AIMessageChunk> {
+  if (!llm.bindTools) {
+    throw new Error("LLM does not support tool binding");
+  }
+
+  const hasOptions = options !== undefined && Object.keys(options).length > 0;
+  const key = JSON.stringify([tools.map((t) => t.name), hasOptions ? options : null]);
+
+  let byKey = boundModels.get(llm);
+  if (!byKey) {
+    byKey = new Map();
+    boundModels.set(llm, byKey);
+  }
+
+  let bound = byKey.get(key);
+  if (!bound) {
+    bound = llm.bindTools(
+      tools,
+      hasOptions ? (options as Partial<BaseChatModelCallOptions>) : undefined
+    );
+    byKey.set(key, bound);
+  }
+  return bound;
+}
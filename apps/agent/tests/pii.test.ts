@@ -0,0 +1,21 @@
+import { describe, expect, test } from "bun:test";
+import { detectPII } from "../src/agent/middleware/pii.js";
+
+describe("detectPII", () => {
+  test("returns nothing for clean text", () => {
+    expect(detectPII("nothing sensitive here")).toEqual([]);
+  });
+
+  test("reports each type in PII_PATTERNS order", () => {
+    expect(detectPII("ssn 123-45-6789, mail a@b.com, call 555-123-4567")).toEqual([
+      "email",
+      "phone",
+      "ssn",
+    ]);
+  });
+
+  test("reports a phone number used as an email local part", () => {
+    expect(detectPII("5551234567@mail.com")).toEqual(["email", "phone"]);
+    expect(detectPII("reach me at 555-123-4567@example.com")).toEqual(["email", "phone"]);
+  });
+});
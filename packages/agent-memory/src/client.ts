@@ -1,3 +1,4 @@
+import { createHash } from "node:crypto";
 import { OpenAIEmbeddings } from "@langchain/openai";
 import { v4 as uuidv4 } from "uuid";
 import { QdrantStore } from "./qdrant-store.js";
@@ -15,6 +16,39 @@ interface EmbeddingsInterface {
   embedDocuments(texts: string[]): Promise<number[][]>;
 }
 
+interface PendingEmbedding {
+  text: string;
+  resolve: (vector: number[]) => void;
+  reject: (error: unknown) => void;
+}
+
+/** How long to wait for concurrent embedding requests to join a batch */
+const EMBED_BATCH_WINDOW_MS = 10;
+const MAX_EMBED_BATCH = 32;
+
+/** Recently embedded texts kept by content hash (vectors are ~6 KB each at 1536 dims) */
+const MAX_CACHED_EMBEDDINGS = 256;
+
+/**
+ * Excluded topics compiled into one case-insensitive alternation, so content
+ * is scanned once instead of lower-cased and searched once per topic. Keyed
+ * by the topics array, which is replaced (not mutated) when settings change.
+ */
+const excludedTopicPatterns = new WeakMap<readonly string[], RegExp>();
+
+function getExcludedTopicsPattern(topics: readonly string[]): RegExp {
+  let pattern = excludedTopicPatterns.get(topics);
+  if (!pattern) {
+    const escaped = topics
+      .filter((topic) => topic.length > 0)
+      .map((topic) => topic.replace(/[.*+?^${}()|[\]\\]/g, "\\$&"));
+    // An empty topic matched everything with includes(); keep that behaviour
+    pattern = escaped.length < topics.length ? /(?:)/ : new RegExp(escaped.join("|"), "i");
+    excludedTopicPatterns.set(topics, pattern);
+  }
+  return pattern;
+}
+
 /**
  * Main Memory Client
  *
@@ -27,6 +61,9 @@ export class MemoryClient {
   private readonly config: MemoryConfig;
   private readonly privacySettings: Map<string, PrivacySettings> = new Map();
   private embeddingsAvailable = false;
+  private pendingEmbeddings: PendingEmbedding[] = [];
+  private embedFlushTimer: ReturnType<typeof setTimeout> | null = null;
+  private readonly embeddingCache = new Map<string, Promise<number[]>>();
 
   constructor(config: MemoryConfig) {
     this.config = config;
@@ -90,6 +127,103 @@ export class MemoryClient {
     return this.embeddingsAvailable && this.embeddings !== null;
   }
 
+  /**
+   * Embed a single text, reusing the vector when the same content was embedded
+   * recently (repeated queries, a turn stored right after it was used for
+   * retrieval). The cache holds promises, so identical concurrent requests also
+   * share one call. Least recently used entries are evicted first.
+   */
+  private embed(text: string): Promise<number[]> {
+    const key = createHash("sha256").update(text).digest("base64");
+
+    const cached = this.embeddingCache.get(key);
+    if (cached) {
+      // Re-insert to mark as most recently used
+      this.embeddingCache.delete(key);
+      this.embeddingCache.set(key, cached);
+      return cached;
+    }
+
+    if (this.embeddingCache.size >= MAX_CACHED_EMBEDDINGS) {
+      const oldest = this.embeddingCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.embeddingCache.delete(oldest);
+      }
+    }
+
+    const vector = this.enqueueEmbedding(text);
+    this.embeddingCache.set(key, vector);
+    // Don't keep failures around; the next request should retry
+    vector.catch(() => {
+      if (this.embeddingCache.get(key) === vector) {
+        this.embeddingCache.delete(key);
+      }
+    });
+    return vector;
+  }
+
+  /**
+   * Queue a text for embedding. Requests arriving within EMBED_BATCH_WINDOW_MS of each
+   * other (e.g. retrieval for several threads, or a store racing a retrieve)
+   * are sent as one embedDocuments() call instead of one round-trip each.
+   */
+  private enqueueEmbedding(text: string): Promise<number[]> {
+    return new Promise((resolve, reject) => {
+      this.pendingEmbeddings.push({ text, resolve, reject });
+
+      if (this.pendingEmbeddings.length >= MAX_EMBED_BATCH) {
+        void this.flushEmbeddings();
+      } else if (!this.embedFlushTimer) {
+        this.embedFlushTimer = setTimeout(() => void this.flushEmbeddings(), EMBED_BATCH_WINDOW_MS);
+      }
+    });
+  }
+
+  private async flushEmbeddings(): Promise<void> {
+    if (this.embedFlushTimer) {
+      clearTimeout(this.embedFlushTimer);
+      this.embedFlushTimer = null;
+    }
+
+    const batch = this.pendingEmbeddings;
+    this.pendingEmbeddings = [];
+    if (batch.length === 0) {
+      return;
+    }
+
+    const embeddings = this.embeddings;
+    if (!embeddings) {
+      const error = new Error("No embedding provider available");
+      for (const pending of batch) {
+        pending.reject(error);
+      }
+      return;
+    }
+
+    if (batch.length > 1) {
+      try {
+        const vectors = await embeddings.embedDocuments(batch.map((p) => p.text));
+        if (vectors.length === batch.length) {
+          batch.forEach((pending, i) => pending.resolve(vectors[i]!));
+          return;
+        }
+      } catch {
+        // One bad input (e.g. a text over the model's token limit) fails the
+        // whole request; fall through so only that text's caller is rejected
+      }
+    }
+
+    await Promise.all(
+      batch.map(async (pending) => {
+        try {
+          pending.resolve(await embeddings.embedQuery(pending.text));
+        } catch (error) {
+          pending.reject(error);
+        }
+      })
+    );
+  }
+
   /**
    * Initialize the memory system
    */
@@ -157,7 +291,7 @@ export class MemoryClient {
     let embedding: number[] | undefined;
     if (this.hasEmbeddings()) {
       try {
-        embedding = await this.embeddings?.embedQuery(content);
+        embedding = await this.embed(content);
       } catch (error) {
         console.warn("[MemoryClient] Failed to generate embedding:", error);
       }
@@ -207,7 +341,7 @@ export class MemoryClient {
     let embedding: number[] | undefined;
     if (this.hasEmbeddings()) {
       try {
-        embedding = await this.embeddings?.embedQuery(content);
+        embedding = await this.embed(content);
       } catch (error) {
         console.warn("[MemoryClient] Failed to generate embedding:", error);
       }
@@ -250,7 +384,7 @@ export class MemoryClient {
     }
 
     // Generate query embedding
-    const queryVector = await this.embeddings?.embedQuery(query.query);
+    const queryVector = await this.embed(query.query);
 
     // Get semantic search results
     let results = await this.store.search(queryVector || [], query);
@@ -280,7 +414,7 @@ export class MemoryClient {
       return [];
     }
 
-    const queryVector = await this.embeddings?.embedQuery("recent conversations");
+    const queryVector = await this.embed("recent conversations");
     const results = await this.store.search(queryVector || [], query);
 
     return results
@@ -328,8 +462,7 @@ export class MemoryClient {
       return false;
     }
 
-    const lowerContent = content.toLowerCase();
-    return settings.excluded_topics.some((topic) => lowerContent.includes(topic.toLowerCase()));
+    return getExcludedTopicsPattern(settings.excluded_topics).test(content);
   }
 
   /**
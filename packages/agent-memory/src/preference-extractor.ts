@@ -1,35 +1,91 @@
+import { createHash } from "node:crypto";
 import { HumanMessage, SystemMessage } from "@langchain/core/messages";
 import { ChatOpenAI } from "@langchain/openai";
 import type { Preference } from "./types.js";
 
 /**
- * Preference Extractor
- *
- * Uses LLM to extract user preferences from conversations.
- * Identifies patterns in user behavior and feedback.
+ * Unambiguous phrasings of a lasting preference; no model call is needed to
+ * classify them. One-off requests ("I want you to summarize this") and remarks
+ * ("I like this answer") are left to the classifier.
  */
-export class PreferenceExtractor {
-  private readonly llm: ChatOpenAI;
+const EXPLICIT_PREFERENCE_RE = new RegExp(
+  `\\b(?:${[
+    "i (?:really |generally |usually )?prefer",
+    "from now on",
+    "going forward",
+    "(?:always|never) (?:use|write|answer|respond|reply|include)",
+  ].join("|")})\\b`,
+  "i"
+);
 
-  constructor(apiKey?: string) {
-    this.llm = new ChatOpenAI({
-      modelName: "gpt-4o-mini",
-      temperature: 0.2,
-      openAIApiKey: apiKey,
-    });
+/** Greetings and acknowledgements ("hi", "ok thanks!") that never carry a preference */
+const ACKNOWLEDGEMENT_RE = new RegExp(
+  `^\\s*(?:(?:${[
+    "hi",
+    "hello",
+    "hey",
+    "thanks",
+    "thank you",
+    "thx",
+    "ty",
+    "ok",
+    "okay",
+    "k",
+    "cool",
+    "great",
+    "nice",
+    "perfect",
+    "awesome",
+    "yes",
+    "yep",
+    "yeah",
+    "no",
+    "nope",
+    "sure",
+    "got it",
+    "sounds good",
+  ].join("|")})\\b[\\s!.,]*)+$`,
+  "i"
+);
+
+function isAcknowledgement(content: string): boolean {
+  return content.trim() === "" || ACKNOWLEDGEMENT_RE.test(content);
+}
+
+const JSON_FENCE_RE = /```(?:json)?\s*([\s\S]*?)```/;
+const TRAILING_COMMA_RE = /,(\s*[\]}])/g;
+
+/**
+ * Parse the JSON array in a model response, ignoring any prose or code fence
+ * around it. Slicing between the outermost brackets avoids a backtracking
+ * regex over the whole response. Trailing commas, a common model slip, are
+ * only stripped (on the slow path) when strict parsing fails.
+ */
+function parseJsonArray<T>(content: string): T[] {
+  const body = JSON_FENCE_RE.exec(content)?.[1] ?? content;
+  const start = body.indexOf("[");
+  const end = body.lastIndexOf("]");
+  if (start === -1 || end <= start) {
+    return [];
   }
 
-  /**
-   * Extract preferences from a conversation thread
-   */
-  async extractPreferences(
-    _userId: string,
-    messages: Array<{ role: string; content: string }>
-  ): Promise<Preference[]> {
-    const conversationText = messages.map((m) => `${m.role}: ${m.content}`).join("\n");
+  const json = body.slice(start, end + 1);
+  let parsed: unknown;
+  try {
+    parsed = JSON.parse(json);
+  } catch {
+    parsed = JSON.parse(json.replace(TRAILING_COMMA_RE, "$1"));
+  }
+  return Array.isArray(parsed) ? (parsed as T[]) : [];
+}
 
-    const systemPrompt = new SystemMessage(
-      `You are a preference extraction assistant. Analyze the conversation and extract any user preferences, habits, or patterns you observe.
+/**
+ * System prompts are fixed, so they are built once and sent as an identical
+ * leading message on every call (which also lets provider-side prefix caches
+ * match across requests).
+ */
+const EXTRACTION_SYSTEM_PROMPT = new SystemMessage(
+  `You are a preference extraction assistant. Analyze the conversation and extract any user preferences, habits, or patterns you observe.
 
 Extract preferences in these categories:
 - style: Communication style preferences (concise, detailed, formal, casual, etc.)
@@ -55,30 +111,109 @@ Return ONLY a JSON array in this format:
 ]
 
 If no clear preferences are found, return an empty array [].`
+);
+
+const SUMMARY_SYSTEM_PROMPT = new SystemMessage(
+  `Create a brief, natural language summary of the user's preferences based on the extracted data.`
+);
+
+const CLASSIFIER_SYSTEM_PROMPT = new SystemMessage(
+  `Determine if this message contains a clear preference, opinion, or instruction that should be remembered for future interactions. Answer with just "yes" or "no".`
+);
+
+/**
+ * Extractor models shared across PreferenceExtractor instances, one per API
+ * key (undefined = the OPENAI_API_KEY env default) and output cap, so creating
+ * an extractor per user or request reuses one client and its connection pool.
+ * Keys hold a hash of the API key rather than the key itself, and the cache
+ * is capped so per-user keys cannot grow it without bound.
+ */
+const MAX_CACHED_EXTRACTOR_MODELS = 16;
+const extractorModels = new Map<string, ChatOpenAI>();
+
+function getExtractorModel(apiKey?: string, maxTokens?: number): ChatOpenAI {
+  const keyHash = apiKey ? createHash("sha256").update(apiKey).digest("base64") : null;
+  const key = JSON.stringify([keyHash, maxTokens ?? null]);
+  let llm = extractorModels.get(key);
+  if (!llm) {
+    if (extractorModels.size >= MAX_CACHED_EXTRACTOR_MODELS) {
+      // Map preserves insertion order, so the first key is the oldest entry
+      const oldest = extractorModels.keys().next().value;
+      if (oldest !== undefined) {
+        extractorModels.delete(oldest);
+      }
+    }
+    llm = new ChatOpenAI({
+      modelName: "gpt-4o-mini",
+      temperature: 0.2,
+      openAIApiKey: apiKey,
+      maxTokens,
+    });
+    extractorModels.set(key, llm);
+  }
+  return llm;
+}
+
+/**
+ * The yes/no classifier only needs its first word; capping the completion
+ * stops generation right after it instead of waiting for any explanation the
+ * model might append.
+ */
+const CLASSIFIER_MAX_TOKENS = 3;
+
+/**
+ * Preference Extractor
+ *
+ * Uses LLM to extract user preferences from conversations.
+ * Identifies patterns in user behavior and feedback.
+ */
+export class PreferenceExtractor {
+  private readonly llm: ChatOpenAI;
+  private readonly classifier: ChatOpenAI;
+
+  constructor(apiKey?: string) {
+    this.llm = getExtractorModel(apiKey);
+    this.classifier = getExtractorModel(apiKey, CLASSIFIER_MAX_TOKENS);
+  }
+
+  /**
+   * Extract preferences from a conversation thread
+   */
+  async extractPreferences(
+    _userId: string,
+    messages: Array<{ role: string; content: string }>
+  ): Promise<Preference[]> {
+    // Preferences come from what the user says; if every user turn is just a
+    // greeting or acknowledgement ("hi", "thanks", "ok"), there is nothing to ask
+    // about. Short instructions ("Be concise") still go to the model.
+    const hasCandidate = messages.some(
+      (m) =>
+        (m.role === "user" || m.role === "human") &&
+        (EXPLICIT_PREFERENCE_RE.test(m.content) || !isAcknowledgement(m.content))
     );
+    if (!hasCandidate) {
+      return [];
+    }
+
+    const conversationText = messages.map((m) => `${m.role}: ${m.content}`).join("\n");
 
     const userPrompt = new HumanMessage(
       `Extract user preferences from this conversation:\n\n${conversationText}`
     );
 
     try {
-      const response = await this.llm.invoke([systemPrompt, userPrompt]);
+      const response = await this.llm.invoke([EXTRACTION_SYSTEM_PROMPT, userPrompt]);
       const content = response.content as string;
 
-      // Extract JSON from response
-      const jsonMatch = content.match(/\[[\s\S]*\]/);
-      if (!jsonMatch) {
-        return [];
-      }
-
-      const preferences: Omit<Preference, "source_message_id" | "extracted_at">[] = JSON.parse(
-        jsonMatch[0]
+      const preferences = parseJsonArray<Omit<Preference, "source_message_id" | "extracted_at">>(
+        content
       );
 
+      const extractedAt = new Date().toISOString();
       return preferences.map((p) => ({
         ...p,
         source_message_id: "extracted_batch",
-        extracted_at: new Date().toISOString(),
+        extracted_at: extractedAt,
       }));
     } catch (error) {
       console.error("[PreferenceExtractor] Failed to extract preferences:", error);
@@ -98,14 +233,10 @@ If no clear preferences are found, return an empty array [].`
       .map((p) => `- ${p.key}: ${p.value} (confidence: ${p.confidence})`)
       .join("\n");
 
-    const systemPrompt = new SystemMessage(
-      `Create a brief, natural language summary of the user's preferences based on the extracted data.`
-    );
-
     const userPrompt = new HumanMessage(`Summarize these user preferences:\n\n${preferencesText}`);
 
     try {
-      const response = await this.llm.invoke([systemPrompt, userPrompt]);
+      const response = await this.llm.invoke([SUMMARY_SYSTEM_PROMPT, userPrompt]);
       return response.content as string;
     } catch (error) {
       console.error("[PreferenceExtractor] Failed to generate summary:", error);
@@ -117,14 +248,18 @@ If no clear preferences are found, return an empty array [].`
    * Check if a message indicates a preference
    */
   async isPreferenceStatement(content: string): Promise<boolean> {
-    const systemPrompt = new SystemMessage(
-      `Determine if this message contains a clear preference, opinion, or instruction that should be remembered for future interactions. Answer with just "yes" or "no".`
-    );
+    // Settle the clear-cut cases locally and only ask the model about the rest
+    if (EXPLICIT_PREFERENCE_RE.test(content)) {
+      return true;
+    }
+    if (isAcknowledgement(content)) {
+      return false;
+    }
 
     const userPrompt = new HumanMessage(`Message: "${content}"`);
 
     try {
-      const response = await this.llm.invoke([systemPrompt, userPrompt]);
+      const response = await this.classifier.invoke([CLASSIFIER_SYSTEM_PROMPT, userPrompt]);
       const answer = (response.content as string).toLowerCase().trim();
       return answer.includes("yes");
     } catch (_error) {
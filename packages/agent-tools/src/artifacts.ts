@@ -1,4 +1,4 @@
-import fs from "node:fs";
+import fs from "node:fs/promises";
 import path from "node:path";
 import { getGlobalDataDir } from "@horizon/shared-utils";
 import { tool } from "@langchain/core/tools";
@@ -29,58 +29,112 @@ function ensureDataDir() {
   getGlobalDataDir(); // This creates the directory if it doesn't exist
 }
 
-function loadArtifactsDb(): ArtifactsDb {
+async function loadArtifactsDb(): Promise<ArtifactsDb> {
   try {
     ensureDataDir();
-    const artifactsDbPath = getArtifactsDbPath();
-    if (fs.existsSync(artifactsDbPath)) {
-      return JSON.parse(fs.readFileSync(artifactsDbPath, "utf-8"));
-    }
+    return JSON.parse(await fs.readFile(getArtifactsDbPath(), "utf-8"));
   } catch (error) {
-    console.error("[Artifacts] Error loading database:", error);
+    if ((error as NodeJS.ErrnoException).code !== "ENOENT") {
+      console.error("[Artifacts] Error loading database:", error);
+    }
   }
   return { artifacts: [] };
 }
 
-function saveArtifactsDb(db: ArtifactsDb): void {
+/**
+ * Write to a temp file and rename it over the database so readers (including
+ * the web app, which reads the same file) never see a partially written file.
+ */
+async function saveArtifactsDb(db: ArtifactsDb): Promise<void> {
   ensureDataDir();
-  const artifactsDbPath = getArtifactsDbPath();
-  fs.writeFileSync(artifactsDbPath, JSON.stringify(db, null, 2));
+  const dbPath = getArtifactsDbPath();
+  const tmpPath = `${dbPath}.${process.pid}.tmp`;
+  await fs.writeFile(tmpPath, JSON.stringify(db, null, 2));
+  await fs.rename(tmpPath, dbPath);
+}
+
+/**
+ * Read-modify-write updates of the artifacts file are chained so concurrent
+ * tool calls (now that file I/O no longer blocks the event loop) cannot
+ * interleave and drop each other's writes.
+ */
+let artifactsDbQueue: Promise<unknown> = Promise.resolve();
+
+function updateArtifactsDb<T>(update: (db: ArtifactsDb) => T | Promise<T>): Promise<T> {
+  const run = artifactsDbQueue.then(async () => {
+    const db = await loadArtifactsDb();
+    const result = await update(db);
+    await saveArtifactsDb(db);
+    return result;
+  });
+  artifactsDbQueue = run.catch(() => undefined);
+  return run;
+}
+
+/**
+ * Read the artifacts file behind any queued updates, so a lookup issued after
+ * a create in the same process sees that artifact.
+ */
+function readArtifactsDb(): Promise<ArtifactsDb> {
+  const run = artifactsDbQueue.then(loadArtifactsDb);
+  artifactsDbQueue = run.catch(() => undefined);
+  return run;
 }
 
+/**
+ * Prettier is loaded lazily on first use and the module promise is reused
+ * for every later artifact instead of re-entering the dynamic import.
+ */
+let prettierModule: Promise<typeof import("prettier")> | null = null;
+
+function loadPrettier(): Promise<typeof import("prettier")> {
+  if (!prettierModule) {
+    prettierModule = import("prettier");
+    // Allow a later call to retry if the first load fails
+    prettierModule.catch(() => {
+      prettierModule = null;
+    });
+  }
+  return prettierModule;
+}
+
+/**
+ * Prettier parser per artifact type; "code" artifacts resolve by language.
+ * Types without an entry (svg, mermaid, ...) are stored unformatted.
+ */
+const ARTIFACT_TYPE_PARSERS: ReadonlyMap<string, string> = new Map([
+  ["html", "html"],
+  ["react", "babel"],
+  ["markdown", "markdown"],
+]);
+
+const CODE_LANGUAGE_PARSERS: ReadonlyMap<string, string> = new Map([
+  ["js", "babel"],
+  ["javascript", "babel"],
+  ["jsx", "babel"],
+  ["ts", "typescript"],
+  ["typescript", "typescript"],
+  ["tsx", "babel-ts"],
+  ["json", "json"],
+  ["jsonc", "json"],
+  ["css", "css"],
+  ["scss", "css"],
+  ["less", "css"],
+  ["html", "html"],
+  ["md", "markdown"],
+  ["markdown", "markdown"],
+]);
+
 async function formatContent(content: string, type: string, language?: string): Promise<string> {
   try {
-    const prettier = await import("prettier");
-
-    let parser: string | null = null;
-
-    switch (type) {
-      case "html":
-        parser = "html";
-        break;
-      case "react":
-        parser = "babel";
-        break;
-      case "markdown":
-        parser = "markdown";
-        break;
-      case "code": {
-        const lang = (language || "").toLowerCase();
-        if (["js", "javascript", "jsx"].includes(lang)) parser = "babel";
-        else if (["ts", "typescript"].includes(lang)) parser = "typescript";
-        else if (["tsx"].includes(lang)) parser = "babel-ts";
-        else if (["json", "jsonc"].includes(lang)) parser = "json";
-        else if (["css", "scss", "less"].includes(lang)) parser = "css";
-        else if (["html"].includes(lang)) parser = "html";
-        else if (["md", "markdown"].includes(lang)) parser = "markdown";
-        break;
-      }
-      default:
-        return content;
-    }
+    const parser =
+      type === "code"
+        ? CODE_LANGUAGE_PARSERS.get((language || "").toLowerCase())
+        : ARTIFACT_TYPE_PARSERS.get(type);
 
     if (!parser) return content;
 
+    const prettier = await loadPrettier();
     const formatted = await prettier.default.format(content, {
       parser,
       printWidth: 100,
@@ -125,31 +179,30 @@ export const createArtifactTool = tool(
     const formattedContent = await formatContent(content, type, language);
 
     const now = new Date().toISOString();
-    const db = loadArtifactsDb();
+    const artifact = await updateArtifactsDb((db): StoredArtifact => {
+      const existingIndex = db.artifacts.findIndex(
+        (a) => a.threadId === threadId && a.title === title && a.type === type
+      );
 
-    const existingIndex = db.artifacts.findIndex(
-      (a) => a.threadId === threadId && a.title === title && a.type === type
-    );
+      if (existingIndex >= 0) {
+        const existing = db.artifacts[existingIndex]!;
+        const updated: StoredArtifact = {
+          id: existing.id,
+          threadId: existing.threadId,
+          title: existing.title,
+          fileName: fileName || existing.fileName,
+          type: existing.type,
+          language: language ?? existing.language,
+          content: formattedContent,
+          version: existing.version + 1,
+          createdAt: existing.createdAt,
+          updatedAt: now,
+        };
+        db.artifacts[existingIndex] = updated;
+        return updated;
+      }
 
-    let artifact: StoredArtifact;
-
-    if (existingIndex >= 0) {
-      const existing = db.artifacts[existingIndex]!;
-      artifact = {
-        id: existing.id,
-        threadId: existing.threadId,
-        title: existing.title,
-        fileName: fileName || existing.fileName,
-        type: existing.type,
-        language: language ?? existing.language,
-        content: formattedContent,
-        version: existing.version + 1,
-        createdAt: existing.createdAt,
-        updatedAt: now,
-      };
-      db.artifacts[existingIndex] = artifact;
-    } else {
-      artifact = {
+      const created: StoredArtifact = {
         id: `artifact-${Date.now()}-${Math.random().toString(36).slice(2, 8)}`,
         threadId,
         title,
@@ -161,10 +214,9 @@ export const createArtifactTool = tool(
         createdAt: now,
         updatedAt: now,
       };
-      db.artifacts.push(artifact);
-    }
-
-    saveArtifactsDb(db);
+      db.artifacts.push(created);
+      return created;
+    });
 
     console.log(
       `[Artifacts] Created artifact: ${artifact.id} (${artifact.title}, ${artifact.type}, v${artifact.version})`
@@ -217,7 +269,7 @@ export const createArtifactTool = tool(
 
 export const presentArtifactTool = tool(
   async ({ artifact_id }: { artifact_id: string }) => {
-    const db = loadArtifactsDb();
+    const db = await readArtifactsDb();
     const query = artifact_id.trim();
 
     let artifact = db.artifacts.find((a) => a.id === query);
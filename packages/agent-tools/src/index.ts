@@ -54,11 +54,10 @@ export const TOOL_CATEGORIES = {
 
 export type ToolRiskLevel = "safe" | "dangerous";
 
+const DANGEROUS_TOOLS: ReadonlySet<string> = new Set(TOOL_CATEGORIES.dangerous);
+
 export function getToolRiskLevel(toolName: string): ToolRiskLevel {
-  if (TOOL_CATEGORIES.dangerous.includes(toolName as (typeof TOOL_CATEGORIES.dangerous)[number])) {
-    return "dangerous";
-  }
-  return "safe";
+  return DANGEROUS_TOOLS.has(toolName) ? "dangerous" : "safe";
 }
 
 export function isDangerousTool(toolName: string): boolean {
@@ -10,6 +10,7 @@
  */
 
 import { spawn as nodeSpawn } from "node:child_process";
+import { StringDecoder } from "node:string_decoder";
 import { ExitError, PermissionError, ShellError, TimeoutError } from "./errors.js";
 import { CommandHistory } from "./history.js";
 import { getPlatformInfo, type PlatformInfo } from "./platform.js";
@@ -100,6 +101,84 @@ const DEFAULT_DANGEROUS_PATTERNS: RegExp[] = [
   /\breg\s+(add|delete)/i,
 ];
 
+/** Numbered backreferences, which would point at the wrong group once fused */
+const NUMBERED_BACKREF_RE = /\\[1-9]/;
+
+/**
+ * Combine patterns into a single alternation that matches if any of them does.
+ * Returns null, in which case callers test each pattern directly, when that is
+ * not equivalent: mixed or stateful (g/y) flags, numbered backreferences, or
+ * sources that cannot be combined (e.g. a group name used by two patterns).
+ */
+function fusePatterns(patterns: RegExp[]): RegExp | null {
+  const flags = patterns[0]?.flags;
+  if (
+    flags === undefined ||
+    /[gy]/.test(flags) ||
+    patterns.some((p) => p.flags !== flags || NUMBERED_BACKREF_RE.test(p.source))
+  ) {
+    return null;
+  }
+
+  try {
+    return new RegExp(patterns.map((p) => `(?:${p.source})`).join("|"), flags);
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Accumulates process output up to `limit` characters (the same unit as the
+ * maxOutputSize check on the combined output); anything past it is dropped
+ * and recorded in `truncated`. A StringDecoder carries multi-byte UTF-8
+ * sequences split across chunks over to the next write.
+ */
+class OutputCollector {
+  private readonly decoder = new StringDecoder("utf8");
+  private readonly parts: string[] = [];
+  private readonly limit: number;
+  private length = 0;
+  truncated = false;
+
+  constructor(limit: number) {
+    this.limit = limit;
+  }
+
+  push(chunk: Buffer): void {
+    if (this.truncated) return;
+    this.append(this.decoder.write(chunk));
+  }
+
+  toString(): string {
+    if (!this.truncated) {
+      this.append(this.decoder.end());
+    }
+    return this.parts.join("");
+  }
+
+  private append(text: string): void {
+    const remaining = this.limit - this.length;
+    if (text.length <= remaining) {
+      this.parts.push(text);
+      this.length += text.length;
+      return;
+    }
+
+    let end = remaining;
+    // Don't leave half of a surrogate pair at the cut
+    if (end > 0 && isHighSurrogate(text.charCodeAt(end - 1))) {
+      end--;
+    }
+    this.parts.push(text.slice(0, end));
+    this.length += end;
+    this.truncated = true;
+  }
+}
+
+function isHighSurrogate(code: number): boolean {
+  return code >= 0xd800 && code <= 0xdbff;
+}
+
 export class ShellExecutor {
   private readonly config: Required<
     Omit<
@@ -114,6 +193,7 @@ export class ShellExecutor {
   private readonly history: CommandHistory;
   private readonly platform: PlatformInfo;
   private readonly useBun: boolean;
+  private readonly dangerousPrecheck: RegExp | null;
 
   constructor(config: ShellConfig = {}) {
     this.platform = getPlatformInfo();
@@ -149,12 +229,20 @@ export class ShellExecutor {
       maxEntries: this.config.maxHistoryEntries,
       maxOutputSize: this.config.maxOutputSize,
     });
+
+    this.dangerousPrecheck = fusePatterns(this.config.dangerousPatterns);
   }
 
   private checkDangerous(command: string): {
     isDangerous: boolean;
     matchedPatterns: string[];
   } {
+    // Most commands are harmless: one scan with the fused pattern settles them,
+    // and the individual patterns only run to report which ones matched
+    if (this.dangerousPrecheck && !this.dangerousPrecheck.test(command)) {
+      return { isDangerous: false, matchedPatterns: [] };
+    }
+
     const matchedPatterns: string[] = [];
 
     for (const pattern of this.config.dangerousPatterns) {
@@ -225,14 +313,23 @@ export class ShellExecutor {
     cwd: string,
     env: Record<string, string>,
     timeout: number
-  ): Promise<{ stdout: string; stderr: string; exitCode: number; signal?: string }> {
+  ): Promise<{
+    stdout: string;
+    stderr: string;
+    exitCode: number;
+    signal?: string;
+    truncated: boolean;
+  }> {
     return new Promise((resolve, reject) => {
       const isWindows = this.platform.isWindows;
       const shell = isWindows ? "cmd.exe" : "/bin/sh";
       const shellArgs = isWindows ? ["/c", command] : ["-c", command];
 
-      let stdout = "";
-      let stderr = "";
+      // Collect decoded parts and join once at the end: cheaper than growing a
+      // string per chunk, and multi-byte characters split across chunk
+      // boundaries decode correctly
+      const stdout = new OutputCollector(this.config.maxOutputSize);
+      const stderr = new OutputCollector(this.config.maxOutputSize);
       let killed = false;
 
       const child = nodeSpawn(shell, shellArgs, {
@@ -247,32 +344,23 @@ export class ShellExecutor {
       }, timeout);
 
       child.stdout?.on("data", (data: Buffer) => {
-        const str = data.toString();
-        if (stdout.length + str.length <= this.config.maxOutputSize) {
-          stdout += str;
-        }
-        if (this.config.onStdout) {
-          this.config.onStdout(str);
-        }
+        stdout.push(data);
+        this.config.onStdout?.(data.toString());
       });
 
       child.stderr?.on("data", (data: Buffer) => {
-        const str = data.toString();
-        if (stderr.length + str.length <= this.config.maxOutputSize) {
-          stderr += str;
-        }
-        if (this.config.onStderr) {
-          this.config.onStderr(str);
-        }
+        stderr.push(data);
+        this.config.onStderr?.(data.toString());
       });
 
       child.on("close", (code, signal) => {
         clearTimeout(timer);
         resolve({
-          stdout,
-          stderr,
+          stdout: stdout.toString(),
+          stderr: stderr.toString(),
           exitCode: killed ? 124 : (code ?? 0),
           signal: killed ? "SIGTERM" : (signal ?? undefined),
+          truncated: stdout.truncated || stderr.truncated,
         });
       });
 
@@ -328,9 +416,16 @@ export class ShellExecutor {
     let stderr = "";
     let exitCode = 0;
     let signal: string | undefined;
+    let truncated = false;
 
     try {
-      let result: { stdout: string; stderr: string; exitCode: number; signal?: string };
+      let result: {
+        stdout: string;
+        stderr: string;
+        exitCode: number;
+        signal?: string;
+        truncated?: boolean;
+      };
 
       if (this.useBun) {
         result = await this.executeWithBun(command, cwd, env);
@@ -342,6 +437,7 @@ export class ShellExecutor {
       stderr = result.stderr;
       exitCode = result.exitCode;
       signal = result.signal;
+      truncated = result.truncated ?? false;
     } catch (error) {
       if (error instanceof TimeoutError) {
         throw error;
@@ -356,7 +452,6 @@ export class ShellExecutor {
     }
 
     let combined = stdout + stderr;
-    let truncated = false;
 
     if (combined.length > this.config.maxOutputSize) {
       const half = Math.floor(this.config.maxOutputSize / 2);
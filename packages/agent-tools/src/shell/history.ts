@@ -125,16 +125,25 @@ export class CommandHistory {
     failed: number;
     averageDuration: number;
   } {
-    const completed = this.entries.filter((e) => e.duration !== undefined);
+    let successful = 0;
+    let failed = 0;
+    let timed = 0;
+    let totalDuration = 0;
+
+    for (const e of this.entries) {
+      if (e.success) successful++;
+      else if (e.exitCode !== undefined) failed++;
+      if (e.duration !== undefined) {
+        timed++;
+        totalDuration += e.duration;
+      }
+    }
 
     return {
       total: this.entries.length,
-      successful: this.entries.filter((e) => e.success).length,
-      failed: this.entries.filter((e) => !e.success && e.exitCode !== undefined).length,
-      averageDuration:
-        completed.length > 0
-          ? completed.reduce((sum, e) => sum + (e.duration ?? 0), 0) / completed.length
-          : 0,
+      successful,
+      failed,
+      averageDuration: timed > 0 ? totalDuration / timed : 0,
     };
   }
 
@@ -143,8 +152,15 @@ export class CommandHistory {
   }
 
   fromJSON(json: string): void {
-    const parsed = JSON.parse(json) as HistoryEntry[];
-    this.entries = parsed.map((e) => ({
+    this.restore(JSON.parse(json) as HistoryEntry[]);
+  }
+
+  /**
+   * Replace the history with already-parsed entries (e.g. from a JSON document
+   * that embeds them), reviving the serialized dates.
+   */
+  restore(entries: HistoryEntry[]): void {
+    this.entries = entries.map((e) => ({
       ...e,
       startTime: new Date(e.startTime),
       endTime: e.endTime ? new Date(e.endTime) : undefined,
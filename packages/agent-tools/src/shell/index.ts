@@ -45,6 +45,21 @@ interface QueuedCommand {
   options?: Parameters<ShellExecutor["execute"]>[1];
 }
 
+/** Commands handled in-process by InteractiveShell.handleBuiltins */
+const SHELL_BUILTINS: ReadonlySet<string> = new Set([
+  "cd",
+  "pwd",
+  "export",
+  "unset",
+  "history",
+  "clear",
+  "cls",
+  "exit",
+  "quit",
+]);
+
+const FIRST_WORD_RE = /^\S+/;
+
 /**
  * Interactive Shell - Stateful command execution with session management
  */
@@ -211,10 +226,14 @@ export class InteractiveShell {
   }
 
   private async handleBuiltins(command: string): Promise<ExecutionResult | null> {
+    // Most commands are not builtins, so look at the first word only and leave
+    // (potentially long) scripts unsplit unless a builtin actually needs args
     const trimmed = command.trim();
-    const parts = trimmed.split(/\s+/);
-    const cmd = parts[0]?.toLowerCase() ?? "";
-    const args = parts.slice(1);
+    const cmd = FIRST_WORD_RE.exec(trimmed)?.[0].toLowerCase() ?? "";
+    if (!SHELL_BUILTINS.has(cmd)) {
+      return null;
+    }
+    const args = trimmed.split(/\s+/).slice(1);
 
     const createResult = (stdout: string): ExecutionResult => ({
       id: `builtin-${Date.now()}`,
@@ -435,9 +454,11 @@ export class InteractiveShell {
   }
 
   toJSON(): string {
+    // Embed the entries directly so the session is serialized in a single pass,
+    // rather than nesting a pretty-printed history string that gets re-escaped.
     return JSON.stringify({
       state: this.state,
-      history: this.executor.getHistory().toJSON(),
+      history: this.executor.getHistory().getAll(),
     });
   }
 
@@ -457,8 +478,11 @@ export class InteractiveShell {
       lastActivity: new Date(state.lastActivity),
     };
 
-    if (history) {
+    if (typeof history === "string") {
+      // Sessions saved before the history was embedded as an array
       shell.executor.getHistory().fromJSON(history);
+    } else if (Array.isArray(history)) {
+      shell.executor.getHistory().restore(history);
     }
 
     return shell;
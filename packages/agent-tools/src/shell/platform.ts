@@ -32,10 +32,21 @@ export function detectOS(): PlatformInfo["os"] {
   }
 }
 
+let cachedPlatformInfo: Readonly<PlatformInfo> | null = null;
+
 /**
- * Get comprehensive platform information
+ * Get comprehensive platform information. None of it changes while the
+ * process runs, so it is detected once and the same frozen object is shared
+ * by every caller (including per-call helpers like normalizePath).
  */
 export function getPlatformInfo(): PlatformInfo {
+  if (!cachedPlatformInfo) {
+    cachedPlatformInfo = Object.freeze(detectPlatformInfo());
+  }
+  return cachedPlatformInfo;
+}
+
+function detectPlatformInfo(): PlatformInfo {
   const os = detectOS();
   const arch = process.arch as PlatformInfo["arch"];
 
@@ -45,12 +45,59 @@ interface SearchResponse {
   summaries?: SearchSummary[];
 }
 
+const FETCH_TIMEOUT_MS = 15_000;
+
+const PAGE_FETCH_HEADERS = {
+  "User-Agent": "Mozilla/5.0 (compatible; HorizonAgent/1.0)",
+} as const;
+
+const SEARCH_HEADERS = {
+  "User-Agent":
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+  Accept: "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+  "Accept-Language": "en-US,en;q=0.5",
+} as const;
+
+/**
+ * Script, style and comment blocks typically make up a large share of a page's
+ * bytes and are discarded anyway. Stripping them in one regex pass before
+ * handing the HTML to cheerio keeps the parsed DOM small.
+ */
+const STRIP_NON_CONTENT_RE =
+  /<script\b[^>]*>[\s\S]*?<\/script>|<style\b[^>]*>[\s\S]*?<\/style>|<!--[\s\S]*?-->/gi;
+
+function stripNonContent(html: string): string {
+  return html.replace(STRIP_NON_CONTENT_RE, "");
+}
+
+const WHITESPACE_RUN_RE = /\s+/g;
+
+/**
+ * Collapse whitespace runs to single spaces, stopping once `limit` characters
+ * have been produced. Equivalent to `text.replace(/\s+/g, " ").slice(0, limit)`
+ * without normalizing (and copying) the rest of a long page.
+ */
+function collapseWhitespace(text: string, limit: number): string {
+  let out = "";
+  let last = 0;
+  for (const match of text.matchAll(WHITESPACE_RUN_RE)) {
+    const start = match.index ?? 0;
+    out += text.slice(last, start);
+    if (out.length >= limit) {
+      return out.slice(0, limit);
+    }
+    out += " ";
+    last = start + match[0].length;
+  }
+  out += text.slice(last);
+  return out.length > limit ? out.slice(0, limit) : out;
+}
+
 async function extractUrlContent(url: string): Promise<string> {
   try {
     const response = await fetch(url, {
-      headers: {
-        "User-Agent": "Mozilla/5.0 (compatible; HorizonAgent/1.0)",
-      },
+      headers: PAGE_FETCH_HEADERS,
+      signal: AbortSignal.timeout(FETCH_TIMEOUT_MS),
     });
 
     if (!response.ok) {
@@ -58,7 +105,7 @@ async function extractUrlContent(url: string): Promise<string> {
     }
 
     const html = await response.text();
-    const $ = cheerio.load(html);
+    const $ = cheerio.load(stripNonContent(html));
 
     $("script").remove();
     $("style").remove();
@@ -67,11 +114,10 @@ async function extractUrlContent(url: string): Promise<string> {
     $("header").remove();
     $("aside").remove();
 
-    let content = $("main").text().trim() || $("article").text().trim() || $("body").text().trim();
-
-    content = content.replace(/\s+/g, " ").slice(0, 3000);
+    const content =
+      $("main").text().trim() || $("article").text().trim() || $("body").text().trim();
 
-    return content;
+    return collapseWhitespace(content, 3000);
   } catch {
     return "";
   }
@@ -85,12 +131,8 @@ export const searchWeb = tool(
       const searchUrl = `https://html.duckduckgo.com/html/?q=${encodeURIComponent(query)}`;
 
       const response = await fetch(searchUrl, {
-        headers: {
-          "User-Agent":
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-          Accept: "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-          "Accept-Language": "en-US,en;q=0.5",
-        },
+        headers: SEARCH_HEADERS,
+        signal: AbortSignal.timeout(FETCH_TIMEOUT_MS),
       });
 
       if (!response.ok) {
@@ -179,12 +221,42 @@ export const searchWeb = tool(
   }
 );
 
+/** WMO weather interpretation codes returned by Open-Meteo */
+const WEATHER_CODES: ReadonlyMap<number, string> = new Map([
+  [0, "Clear sky"],
+  [1, "Mainly clear"],
+  [2, "Partly cloudy"],
+  [3, "Overcast"],
+  [45, "Foggy"],
+  [48, "Depositing rime fog"],
+  [51, "Light drizzle"],
+  [53, "Moderate drizzle"],
+  [55, "Dense drizzle"],
+  [61, "Slight rain"],
+  [63, "Moderate rain"],
+  [65, "Heavy rain"],
+  [71, "Slight snow"],
+  [73, "Moderate snow"],
+  [75, "Heavy snow"],
+  [77, "Snow grains"],
+  [80, "Slight rain showers"],
+  [81, "Moderate rain showers"],
+  [82, "Violent rain showers"],
+  [85, "Slight snow showers"],
+  [86, "Heavy snow showers"],
+  [95, "Thunderstorm"],
+  [96, "Thunderstorm with slight hail"],
+  [99, "Thunderstorm with heavy hail"],
+]);
+
 export const getWeather = tool(
   async ({ city }) => {
     try {
       const geocodeUrl = `https://geocoding-api.open-meteo.com/v1/search?name=${encodeURIComponent(city)}&count=1&language=en&format=json`;
 
-      const geocodeResponse = await fetch(geocodeUrl);
+      const geocodeResponse = await fetch(geocodeUrl, {
+        signal: AbortSignal.timeout(FETCH_TIMEOUT_MS),
+      });
       if (!geocodeResponse.ok) {
         throw new Error(`Geocoding failed with status ${geocodeResponse.status}`);
       }
@@ -203,7 +275,9 @@ export const getWeather = tool(
 
       const weatherUrl = `https://api.open-meteo.com/v1/forecast?latitude=${latitude}&longitude=${longitude}&current=temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code&timezone=auto`;
 
-      const weatherResponse = await fetch(weatherUrl);
+      const weatherResponse = await fetch(weatherUrl, {
+        signal: AbortSignal.timeout(FETCH_TIMEOUT_MS),
+      });
       if (!weatherResponse.ok) {
         throw new Error(`Weather fetch failed with status ${weatherResponse.status}`);
       }
@@ -211,34 +285,7 @@ export const getWeather = tool(
       const weatherData = (await weatherResponse.json()) as WeatherResponse;
       const current = weatherData.current;
 
-      const weatherCodeMap: Record<number, string> = {
-        0: "Clear sky",
-        1: "Mainly clear",
-        2: "Partly cloudy",
-        3: "Overcast",
-        45: "Foggy",
-        48: "Depositing rime fog",
-        51: "Light drizzle",
-        53: "Moderate drizzle",
-        55: "Dense drizzle",
-        61: "Slight rain",
-        63: "Moderate rain",
-        65: "Heavy rain",
-        71: "Slight snow",
-        73: "Moderate snow",
-        75: "Heavy snow",
-        77: "Snow grains",
-        80: "Slight rain showers",
-        81: "Moderate rain showers",
-        82: "Violent rain showers",
-        85: "Slight snow showers",
-        86: "Heavy snow showers",
-        95: "Thunderstorm",
-        96: "Thunderstorm with slight hail",
-        99: "Thunderstorm with heavy hail",
-      };
-
-      const condition = weatherCodeMap[current.weather_code] || "Unknown";
+      const condition = WEATHER_CODES.get(current.weather_code) || "Unknown";
 
       return JSON.stringify({
         city: cityName,
@@ -275,9 +322,8 @@ export const fetchUrlContent = tool(
       }
 
       const response = await fetch(targetUrl, {
-        headers: {
-          "User-Agent": "Mozilla/5.0 (compatible; HorizonAgent/1.0)",
-        },
+        headers: PAGE_FETCH_HEADERS,
+        signal: AbortSignal.timeout(FETCH_TIMEOUT_MS),
       });
 
       if (!response.ok) {
@@ -285,7 +331,7 @@ export const fetchUrlContent = tool(
       }
 
       const html = await response.text();
-      const $ = cheerio.load(html);
+      const $ = cheerio.load(stripNonContent(html));
 
       $("script").remove();
       $("style").remove();
@@ -295,10 +341,10 @@ export const fetchUrlContent = tool(
 
       const title = $("title").text().trim() || "No Title";
 
-      let content =
-        $("main").text().trim() || $("article").text().trim() || $("body").text().trim();
-
-      content = content.replace(/\s+/g, " ").slice(0, 10_000);
+      const content = collapseWhitespace(
+        $("main").text().trim() || $("article").text().trim() || $("body").text().trim(),
+        10_000
+      );
 
       return `# ${title}\n\n${content}`;
     } catch (error) {
@@ -137,33 +137,35 @@ export function createLogger(context: string, options: LoggerOptions = {}): Logg
     config.colors = false;
   }
 
+  const tags = buildTags(context, config);
+
   return {
     trace(message: string, data?: DataArg): void {
-      log(LogLevel.TRACE, context, message, data, config);
+      log(LogLevel.TRACE, context, message, data, config, tags);
     },
 
     debug(message: string, data?: DataArg): void {
-      log(LogLevel.DEBUG, context, message, data, config);
+      log(LogLevel.DEBUG, context, message, data, config, tags);
     },
 
     info(message: string, data?: DataArg): void {
-      log(LogLevel.INFO, context, message, data, config);
+      log(LogLevel.INFO, context, message, data, config, tags);
     },
 
     success(message: string, data?: DataArg): void {
-      log(LogLevel.SUCCESS, context, message, data, config);
+      log(LogLevel.SUCCESS, context, message, data, config, tags);
     },
 
     warn(message: string, data?: DataArg): void {
-      log(LogLevel.WARN, context, message, data, config);
+      log(LogLevel.WARN, context, message, data, config, tags);
     },
 
     error(message: string, error?: ErrorArg): void {
-      log(LogLevel.ERROR, context, message, extractErrorData(error), config);
+      log(LogLevel.ERROR, context, message, extractErrorData(error), config, tags);
     },
 
     fatal(message: string, error?: ErrorArg): void {
-      log(LogLevel.FATAL, context, message, extractErrorData(error), config);
+      log(LogLevel.FATAL, context, message, extractErrorData(error), config, tags);
     },
 
     box(message: string, title?: string): void {
@@ -214,16 +216,45 @@ function extractErrorData(error?: ErrorArg): Record<string, unknown> | undefined
   return error;
 }
 
+/** Per-level badges for the fancy format, styled once instead of on every call */
+const LEVEL_BADGES = Object.fromEntries(
+  Object.entries(LEVEL_META).map(([level, meta]) => [
+    level,
+    { plain: ` [${meta.label}] `, colored: ` ${meta.color(`[${meta.label}]`)} ` },
+  ])
+) as Record<LogLevel, { plain: string; colored: string }>;
+
+/** Context and prefix tags of a logger, rendered once when it is created */
+interface LogTags {
+  simplePrefix: string;
+  fancyContext: string;
+  fancyPrefix: string;
+}
+
+function buildTags(context: string, config: Required<LoggerOptions>): LogTags {
+  const { colors, prefix } = config;
+  return {
+    simplePrefix: prefix ? `[${prefix}] ` : "",
+    fancyContext: colors ? picocolors.cyan(`[${context}]`) : `[${context}]`,
+    fancyPrefix: prefix
+      ? colors
+        ? ` ${picocolors.magenta(`[${prefix}]`)}`
+        : ` [${prefix}]`
+      : "",
+  };
+}
+
 function log(
   level: LogLevel,
   context: string,
   message: string,
   data: Record<string, unknown> | undefined,
-  config: Required<LoggerOptions>
+  config: Required<LoggerOptions>,
+  tags: LogTags
 ): void {
   if (level < config.minLevel) return;
 
-  const { colors, timestamps, prefix, format, trailingNewline } = config;
+  const { colors, timestamps, format, trailingNewline } = config;
   const meta = LEVEL_META[level];
   const printFn = meta.isError ? console.error : console.log;
   const end = trailingNewline ? "\n" : "";
@@ -238,48 +269,62 @@ function log(
   }
 
   if (format === "simple") {
-    const ts = timestamps ? `[${formatTimestamp(new Date())}] ` : "";
-    const prefixStr = prefix ? `[${prefix}] ` : "";
-    const levelStr = `[${meta.label}] `;
-    const ctxStr = `[${context}] `;
-    let line = `${ts}${prefixStr}${levelStr}${ctxStr}${message}`;
+    const ts = timestamps ? `[${formatTimestamp()}] ` : "";
+    let line = `${ts}${tags.simplePrefix}[${meta.label}] [${context}] ${message}`;
     if (meta.emoji) line = `${meta.emoji} ${line}`;
-    printFn(line + end);
+    // Message and data go out in one write
     if (data && Object.keys(data).length > 0) {
-      printFn(JSON.stringify(data, null, 2));
+      line += `${end}\n${JSON.stringify(data, null, 2)}`;
+    } else {
+      line += end;
     }
+    printFn(line);
     return;
   }
 
   // Fancy format
-  const ts = timestamps ? `${picocolors.gray(formatTimestamp(new Date()))} ` : "";
-  const levelBadge = colors ? ` ${meta.color(`[${meta.label}]`)} ` : ` [${meta.label}] `;
+  const ts = timestamps ? `${picocolors.gray(formatTimestamp())} ` : "";
+  const levelBadge = colors ? LEVEL_BADGES[level].colored : LEVEL_BADGES[level].plain;
   const emoji = meta.emoji ? ` ${meta.emoji}` : "";
-  const ctxStr = colors ? picocolors.cyan(`[${context}]`) : `[${context}]`;
-  const prefixStr = prefix
-    ? colors
-      ? ` ${picocolors.magenta(`[${prefix}]`)}`
-      : ` [${prefix}]`
-    : "";
+  const ctxStr = tags.fancyContext;
+  const prefixStr = tags.fancyPrefix;
   const msgStr = colors ? meta.color(message) : message;
   const callerStr = config.showCaller ? ` ${picocolors.gray(getCallerLocation())}` : "";
 
-  printFn(`${ts}${levelBadge}${emoji} ${ctxStr}${prefixStr} ${msgStr}${callerStr}${end}`);
+  let line = `${ts}${levelBadge}${emoji} ${ctxStr}${prefixStr} ${msgStr}${callerStr}${end}`;
 
+  // Message and data go out in one write
   if (data && Object.keys(data).length > 0) {
     const dataStr = colors
       ? picocolors.gray(JSON.stringify(data, null, 2))
       : JSON.stringify(data, null, 2);
-    printFn(`${dataStr}\n`);
+    line += `\n${dataStr}\n`;
   }
+
+  printFn(line);
 }
 
-function formatTimestamp(date: Date): string {
-  const h = date.getHours().toString().padStart(2, "0");
-  const m = date.getMinutes().toString().padStart(2, "0");
-  const s = date.getSeconds().toString().padStart(2, "0");
-  const ms = date.getMilliseconds().toString().padStart(3, "0");
-  return `${h}:${m}:${s}.${ms}`;
+/** Epoch second of the cached "HH:MM:SS" string below */
+let timestampSecond = -1;
+let timestampSecondStr = "";
+
+/**
+ * Format the current time as HH:MM:SS.mmm. The HH:MM:SS part only changes
+ * once per second, so it is cached and only the milliseconds are formatted
+ * per call.
+ */
+function formatTimestamp(now: number = Date.now()): string {
+  const second = Math.floor(now / 1000);
+  if (second !== timestampSecond) {
+    const date = new Date(now);
+    const h = date.getHours().toString().padStart(2, "0");
+    const m = date.getMinutes().toString().padStart(2, "0");
+    const s = date.getSeconds().toString().padStart(2, "0");
+    timestampSecond = second;
+    timestampSecondStr = `${h}:${m}:${s}`;
+  }
+  const ms = now - second * 1000;
+  return `${timestampSecondStr}.${ms < 10 ? "00" : ms < 100 ? "0" : ""}${ms}`;
 }
 
 function getCallerLocation(): string {